@@ -30,6 +30,8 @@ HOW TO RUN
     export GRVT_ENV="testnet"
     export GRVT_N_SAMPLES="20"           # number of orders to submit
     export GRVT_LIMIT_PRICE="1.0"        # far-from-market price (won't fill for REST test)
+    export GRVT_CONCURRENCY="8"          # REST samples kept in flight at once
+    export GRVT_RPS="20"                 # REST request rate limit (requests/s)
 """
 
 from __future__ import annotations
@@ -37,8 +39,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-import statistics
 import time
+from collections import deque
 from decimal import Decimal
 
 from grvt_sdk import (
@@ -49,13 +51,16 @@ from grvt_sdk import (
     OrderLeg,
     OrderMetadata,
     TimeInForce,
-    sign_order,
+    make_signer,
 )
 
 logging.basicConfig(
     level=logging.WARNING,  # suppress SDK noise during benchmark
     format="%(asctime)s  %(levelname)-8s  %(name)s – %(message)s",
 )
+# basicConfig only sets the root level; pin the SDK's own logger too so
+# nothing below ERROR is formatted inside the timed sections.
+logging.getLogger("grvt_sdk").setLevel(logging.ERROR)
 logger = logging.getLogger("latency")
 
 # ---------------------------------------------------------------------------
@@ -70,94 +75,143 @@ INSTRUMENT_HASH = os.environ.get("GRVT_INSTRUMENT_HASH",  "0x" + "ab" * 32)
 ENV             = os.environ.get("GRVT_ENV",              "testnet")
 N_SAMPLES       = int(os.environ.get("GRVT_N_SAMPLES",    "20"))
 LIMIT_PRICE     = os.environ.get("GRVT_LIMIT_PRICE",      "1.0")   # far from market
+CONCURRENCY     = int(os.environ.get("GRVT_CONCURRENCY",  "8"))    # in-flight REST samples
+RPS             = float(os.environ.get("GRVT_RPS",        "20"))   # REST requests per second
 
 VERIFYING_CONTRACT = "0x0000000000000000000000000000000000000000"
 
-QUOTE_TTL_S = 10  # short expiry — these orders are not meant to fill
+QUOTE_TTL_S  = 10  # short expiry — these orders are not meant to fill
+_QUOTE_TTL_NS = QUOTE_TTL_S * 1_000_000_000
+
+# Resolved once – the environment does not change while the process runs
+_CHAIN_ID = GRVTEnv[ENV.upper()].chain_id if ENV.upper() in GRVTEnv.__members__ else 326
+
+_NS_PER_MS = 1_000_000
+
+# Key parsing and the EIP-712 domain hash happen once, not per sample
+_SIGNER = make_signer(PRIVATE_KEY, _CHAIN_ID, VERIFYING_CONTRACT)
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _percentile(data: list[float], p: float) -> float:
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    idx = max(0, int(len(sorted_data) * p / 100) - 1)
-    return sorted_data[idx]
+def _percentile(ordered: list[int], q: float) -> float:
+    """Linearly interpolated percentile (inclusive method) of sorted samples."""
+    pos = q * (len(ordered) - 1)
+    lo  = int(pos)
+    hi  = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
 
+def _print_stats(label: str, samples_ns: list[int]) -> None:
+    """
+    Report latencies in ms; samples stay integer nanoseconds until here.
 
-def _print_stats(label: str, samples_ms: list[float]) -> None:
-    if not samples_ms:
+    One sort serves every statistic: percentiles index into it, max is the
+    last element, and the mean comes from a single sum().
+    """
+    if not samples_ns:
         print(f"  {label}: no samples collected")
         return
-    print(f"\n  {label} ({len(samples_ms)} samples)")
-    print(f"    P50  : {_percentile(samples_ms, 50):8.1f} ms")
-    print(f"    P95  : {_percentile(samples_ms, 95):8.1f} ms")
-    print(f"    P99  : {_percentile(samples_ms, 99):8.1f} ms")
-    print(f"    max  : {max(samples_ms):8.1f} ms")
-    print(f"    mean : {statistics.mean(samples_ms):8.1f} ms")
+    ordered = sorted(samples_ns)
+    n       = len(ordered)
+    print(f"\n  {label} ({n} samples)")
+    print(f"    P50  : {_percentile(ordered, 0.50) / _NS_PER_MS:8.1f} ms")
+    print(f"    P95  : {_percentile(ordered, 0.95) / _NS_PER_MS:8.1f} ms")
+    print(f"    P99  : {_percentile(ordered, 0.99) / _NS_PER_MS:8.1f} ms")
+    print(f"    max  : {ordered[-1] / _NS_PER_MS:8.1f} ms")
+    print(f"    mean : {sum(ordered) / n / _NS_PER_MS:8.1f} ms")
+
+
+class _RateLimiter:
+    """
+    Async token bucket allowing ``rate`` requests per second, with bursts
+    of up to ``rate`` requests.
+
+    Tracks the theoretical arrival time of the next request (GCRA) instead
+    of a token count, so acquiring is one comparison and at most one sleep.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._burst    = max(rate - 1.0, 0.0) * self._interval
+        self._tat      = 0.0
+
+    async def __aenter__(self) -> None:
+        now       = asyncio.get_running_loop().time()
+        tat       = max(self._tat, now)
+        self._tat = tat + self._interval
+        wait      = tat - now - self._burst
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+# Every sample trades the same leg, so it is validated once here and shared
+# by reference (pydantic does not re-validate model instances passed in).
+_LEG = OrderLeg(
+    instrument_hash=INSTRUMENT_HASH,
+    size="0.001",
+    limit_price=LIMIT_PRICE,
+    is_buying_asset=True,
+)
 
 
 def _build_order(nonce_seed: int) -> Order:
-    expiration_ns = (int(time.time()) + QUOTE_TTL_S) * 1_000_000_000
+    now_ns = time.time_ns()   # one clock read for both create_time and expiry
     return Order(
         sub_account_id=SUB_ACCOUNT_ID,
         time_in_force=TimeInForce.GOOD_TILL_TIME,
-        expiration=expiration_ns,
-        legs=[OrderLeg(
-            instrument_hash=INSTRUMENT_HASH,
-            size="0.001",
-            limit_price=LIMIT_PRICE,
-            is_buying_asset=True,
-        )],
+        expiration=now_ns + _QUOTE_TTL_NS,
+        legs=[_LEG],
         metadata=OrderMetadata(
             client_order_id=nonce_seed & 0xFFFF_FFFF,
-            create_time=time.time_ns(),
+            create_time=now_ns,
         ),
         post_only=True,
     )
 
 
-def _sign(order: Order) -> None:
-    chain_id = GRVTEnv[ENV.upper()].chain_id if ENV.upper() in GRVTEnv.__members__ else 326
-    sign_order(
-        order,
-        private_key=PRIVATE_KEY,
-        chain_id=chain_id,
-        verifying_contract=VERIFYING_CONTRACT,
-    )
-
-
 # ---------------------------------------------------------------------------
 # Benchmark 1: REST round-trip latency
 # ---------------------------------------------------------------------------
 
-async def bench_rest_rtt(client: GRVTClient, n: int) -> list[float]:
+async def bench_rest_rtt(client: GRVTClient, n: int) -> list[int]:
     """
     Submit N orders and measure the time from send to HTTP response.
     Uses a far-from-market limit price so orders rest rather than fill.
-    """
-    samples: list[float] = []
-
-    for i in range(n):
-        order = _build_order(i)
-        _sign(order)
-
-        t0 = time.perf_counter()
-        try:
-            resp = await client.rest.create_order(order)
-            elapsed_ms = (time.perf_counter() - t0) * 1000
-            samples.append(elapsed_ms)
-            # Clean up immediately so we don't accumulate open orders
-            if resp.order_id:
-                await client.rest.cancel_order(SUB_ACCOUNT_ID, resp.order_id)
-        except Exception as exc:
-            logger.warning("REST sample %d failed: %s", i, exc)
-
-        # Small pause to avoid rate-limiting
-        await asyncio.sleep(0.05)
 
+    Up to CONCURRENCY submissions are kept in flight over the client's
+    pooled keep-alive connections, so wall-clock time is roughly
+    N / CONCURRENCY round-trips rather than N.  Requests are paced by a
+    token bucket at RPS rather than fixed sleeps; time spent waiting for
+    a token is not part of the sample.  Each sample still times a single
+    create_order() call.
+    """
+    samples: list[int] = []
+    sem     = asyncio.Semaphore(CONCURRENCY)
+    limiter = _RateLimiter(RPS)
+
+    async def one_sample(i: int) -> None:
+        async with sem:
+            order = _build_order(i)
+            _SIGNER.sign(order)
+
+            try:
+                async with limiter:
+                    t0   = time.perf_counter_ns()
+                    resp = await client.rest.create_order(order)
+                    samples.append(time.perf_counter_ns() - t0)
+                # Clean up immediately so we don't accumulate open orders
+                if resp.order_id:
+                    async with limiter:
+                        await client.rest.cancel_order(SUB_ACCOUNT_ID, resp.order_id)
+            except Exception as exc:
+                logger.warning("REST sample %d failed: %s", i, exc)
+
+    await asyncio.gather(*(one_sample(i) for i in range(n)))
     return samples
 
 
@@ -165,7 +219,7 @@ async def bench_rest_rtt(client: GRVTClient, n: int) -> list[float]:
 # Benchmark 2: Fill notification latency (submit → WS fill event)
 # ---------------------------------------------------------------------------
 
-async def bench_fill_notify(client: GRVTClient, n: int) -> list[float]:
+async def bench_fill_notify(client: GRVTClient, n: int) -> list[int]:
     """
     Submit N at-market orders and measure the time from HTTP response
     to the corresponding fill event arriving on the private WS stream.
@@ -175,14 +229,17 @@ async def bench_fill_notify(client: GRVTClient, n: int) -> list[float]:
     which won't fill — set GRVT_LIMIT_PRICE to a realistic bid price
     to get meaningful fill-notify numbers.
     """
-    samples:   list[float]          = []
-    pending:   dict[str, float]     = {}   # order_id → submit_timestamp
-    received:  asyncio.Queue[tuple] = asyncio.Queue()
+    samples:   list[int]              = []
+    pending:   dict[str, int]         = {}   # order_id → submit perf_counter_ns
+    received:  deque[tuple[str, int]] = deque()
+    arrived    = asyncio.Event()             # set whenever received is non-empty
 
     async def on_fill(fill: Fill) -> None:
-        if fill.order_id in pending:
-            elapsed_ms = (time.perf_counter() - pending.pop(fill.order_id)) * 1000
-            await received.put((fill.order_id, elapsed_ms))
+        now_ns = time.perf_counter_ns()
+        t0     = pending.pop(fill.order_id, None)   # one probe; None if not ours
+        if t0 is not None:
+            received.append((fill.order_id, now_ns - t0))
+            arrived.set()
 
     await client.ws.subscribe(f"fills.{INSTRUMENT}", on_fill, msg_type=Fill)
     ws_task = asyncio.create_task(client.ws.run_forever())
@@ -190,28 +247,37 @@ async def bench_fill_notify(client: GRVTClient, n: int) -> list[float]:
     # Give WS time to connect
     await asyncio.sleep(1.0)
 
+    submitted = 0   # orders accepted by the exchange – the number of fills to wait for
     for i in range(n):
         order = _build_order(i + 1000)
-        _sign(order)
+        _SIGNER.sign(order)
 
         try:
-            t0   = time.perf_counter()
+            t0   = time.perf_counter_ns()
             resp = await client.rest.create_order(order)
             if resp.order_id:
                 pending[resp.order_id] = t0
+                submitted += 1
         except Exception as exc:
             logger.warning("Fill bench sample %d failed: %s", i, exc)
 
         await asyncio.sleep(0.1)
 
-    # Wait up to 5 s for fill notifications to arrive
-    deadline = time.perf_counter() + 5.0
-    while len(samples) < len(pending) + len(samples) and time.perf_counter() < deadline:
+    # Wait up to 5 s for a fill per submitted order, draining every fill
+    # that landed since the last wake-up in one go.  Clearing before the
+    # drain cannot lose a wake-up: on_fill only runs while we are awaiting.
+    deadline_ns = time.perf_counter_ns() + 5_000_000_000
+    while True:
+        arrived.clear()
+        while received:
+            samples.append(received.popleft()[1])
+        remaining_ns = deadline_ns - time.perf_counter_ns()
+        if len(samples) >= submitted or remaining_ns <= 0:
+            break
         try:
-            _, elapsed_ms = await asyncio.wait_for(received.get(), timeout=0.5)
-            samples.append(elapsed_ms)
+            await asyncio.wait_for(arrived.wait(), timeout=remaining_ns / 1e9)
         except asyncio.TimeoutError:
-            break
+            pass
 
     ws_task.cancel()
     try:
@@ -252,4 +318,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop   # optional – libuv event loop, not available on Windows
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
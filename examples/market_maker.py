@@ -25,7 +25,7 @@ Architecture
 Key implementation decisions
 -----------------------------
 - Single GRVTClient – REST and WS share one auth instance, one cookie.
-- SeqNonce – sequence-based nonce counter prevents replay rejection on
+- SequenceNonce – sequence-based nonce counter prevents replay rejection on
   rapid re-quoting.  Never reuse a nonce on retry.
 - Short expiration (QUOTE_TTL_S) – quotes expire on the exchange if the
   WS reconnects before we can cancel them.  Prevents stale fills.
@@ -60,7 +60,8 @@ import logging
 import os
 import signal
 import time
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
+from functools import lru_cache
 from typing import Optional
 
 from grvt_sdk import (
@@ -71,8 +72,9 @@ from grvt_sdk import (
     OrderLeg,
     OrderMetadata,
     Orderbook,
+    SequenceNonce,
     TimeInForce,
-    sign_order,
+    make_signer,
 )
 
 logging.basicConfig(
@@ -99,24 +101,32 @@ QUOTE_TTL_S     = int(os.environ.get("GRVT_QUOTE_TTL_S",     "30"))
 
 VERIFYING_CONTRACT = "0x0000000000000000000000000000000000000000"  # replace with real address
 
+# Resolved once – the environment does not change while the process runs
+_CHAIN_ID = GRVTEnv[ENV.upper()].chain_id if ENV.upper() in GRVTEnv.__members__ else 326
 
-# ---------------------------------------------------------------------------
-# Sequence-based nonce – safe for high-frequency quoting
-# ---------------------------------------------------------------------------
+# Decimal constants used when quoting – built once, not per message
+_HALF      = Decimal("0.5")
+_TICK      = Decimal("0.1")
+_HALF_TICK = _TICK * _HALF
 
-class SeqNonce:
-    """
-    Monotonically increasing uint32 nonce.
+# The book is tracked in integer ticks so the per-message re-quote check is
+# plain int arithmetic.  Mid is kept doubled (bid + ask) to avoid halving.
+_TICKS_PER_UNIT = 10          # 1 / _TICK
+_MIN_MOVE_TICKS = 5           # re-quote only when mid moves at least 0.5
 
-    Using a timestamp-based nonce at high quote rates risks collisions.
-    A sequence counter guarantees uniqueness within a session.
+_QUOTE_TTL_NS = QUOTE_TTL_S * 1_000_000_000
+
+
+@lru_cache(maxsize=1024)
+def _to_ticks(price: str) -> int:
     """
-    def __init__(self) -> None:
-        self._n = int(time.time() * 1000) & 0xFFFF_FFFF  # seed from time
+    Parse a wire price string to ticks; top-of-book prices repeat tick to tick.
 
-    def __call__(self) -> int:
-        self._n = (self._n + 1) & 0xFFFF_FFFF
-        return self._n
+    Rounds half-even to the nearest tick: int() would truncate an off-grid
+    price such as "99.99" down to 999 rather than 1000.
+    """
+    scaled = Decimal(price) * _TICKS_PER_UNIT
+    return int(scaled.to_integral_value(rounding=ROUND_HALF_EVEN))
 
 
 # ---------------------------------------------------------------------------
@@ -126,12 +136,38 @@ class SeqNonce:
 class MarketMaker:
     def __init__(self, client: GRVTClient) -> None:
         self._client      = client
-        self._nonce       = SeqNonce()
+        self._nonce       = SequenceNonce()   # timestamp nonces collide at quote rates
         self._bid_id:     Optional[str] = None  # current live bid order_id
         self._ask_id:     Optional[str] = None  # current live ask order_id
         self._position:   Decimal       = Decimal("0")  # net position (+ long, - short)
         self._mid:        Optional[Decimal] = None
-        self._shutdown    = asyncio.Event()
+        self._mid2_ticks: Optional[int]     = None  # bid + ask in ticks, i.e. 2 × mid
+        self._task:       Optional[asyncio.Task[None]] = None   # task running run()
+        # One persistent order per side; _place_order only rewrites the
+        # fields that change between quotes and re-signs in place.
+        self._bid_order   = self._order_template(is_buy=True)
+        self._ask_order   = self._order_template(is_buy=False)
+        # Key parsing and the EIP-712 domain hash happen once, here
+        self._signer      = make_signer(
+            PRIVATE_KEY, _CHAIN_ID, VERIFYING_CONTRACT, nonce_provider=self._nonce,
+        )
+
+    @staticmethod
+    def _order_template(is_buy: bool) -> Order:
+        leg = OrderLeg(
+            instrument_hash=INSTRUMENT_HASH,
+            size=str(QUOTE_SIZE),
+            limit_price=str(_TICK),   # placeholder, overwritten per quote
+            is_buying_asset=is_buy,
+        )
+        return Order(
+            sub_account_id=SUB_ACCOUNT_ID,
+            time_in_force=TimeInForce.GOOD_TILL_TIME,
+            expiration=0,
+            legs=[leg],
+            metadata=OrderMetadata(client_order_id=0, create_time=0),
+            post_only=True,      # maker-only: reject if it would match immediately
+        )
 
     # ------------------------------------------------------------------
     # WebSocket handlers
@@ -142,16 +178,20 @@ class MarketMaker:
         if not book.bids or not book.asks:
             return
 
-        best_bid = Decimal(book.bids[0].price)
-        best_ask = Decimal(book.asks[0].price)
-        mid      = (best_bid + best_ask) / 2
+        mid2 = _to_ticks(book.bids[0].price) + _to_ticks(book.asks[0].price)
 
-        # Only re-quote if mid moved by more than 1 tick (avoid thrash)
-        if self._mid is not None and abs(mid - self._mid) < Decimal("0.5"):
+        # Only re-quote if mid moved by at least _MIN_MOVE_TICKS (avoid thrash)
+        last = self._mid2_ticks
+        if last is not None and abs(mid2 - last) < 2 * _MIN_MOVE_TICKS:
             return
 
-        self._mid = mid
-        logger.info("Mid updated: %s  (bid=%s  ask=%s)", mid, best_bid, best_ask)
+        # Back to Decimal only when we are actually going to quote
+        self._mid2_ticks = mid2
+        self._mid        = mid2 * _HALF_TICK
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Mid updated: %s  (bid=%s  ask=%s)", self._mid, book.bids[0].price, book.asks[0].price,
+            )
         await self._requote()
 
     async def on_fill(self, fill: Fill) -> None:
@@ -166,10 +206,11 @@ class MarketMaker:
         else:
             self._position -= qty
 
-        logger.info(
-            "Fill – %s %s @ %s  |  position now: %s",
-            fill.side.name, fill.size, fill.price, self._position,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Fill – %s %s @ %s  |  position now: %s",
+                fill.side.name, fill.size, fill.price, self._position,
+            )
 
         # Immediately re-quote the filled side
         if fill.side.name == "BUY":
@@ -188,20 +229,24 @@ class MarketMaker:
         if self._mid is None:
             return
 
-        half_spread = SPREAD / 2
+        half_spread = SPREAD * _HALF
         bid_price   = self._mid - half_spread
         ask_price   = self._mid + half_spread
 
+        # Each side cancels its stale quote before placing the replacement,
+        # so the old and new quote are never both resting; the two sides are
+        # independent and run concurrently.
+        stale_bid, self._bid_id = self._bid_id, None
+        stale_ask, self._ask_id = self._ask_id, None
+
         await asyncio.gather(
-            self._refresh_bid(bid_price),
-            self._refresh_ask(ask_price),
+            self._refresh_bid(bid_price, stale_bid),
+            self._refresh_ask(ask_price, stale_ask),
         )
 
-    async def _refresh_bid(self, price: Decimal) -> None:
-        # Cancel existing bid if any
-        if self._bid_id:
-            await self._cancel(self._bid_id)
-            self._bid_id = None
+    async def _refresh_bid(self, price: Decimal, stale_id: Optional[str] = None) -> None:
+        if stale_id:
+            await self._cancel(stale_id)
 
         # Don't post a new bid if already at position limit (long)
         if self._position >= MAX_POSITION:
@@ -219,11 +264,9 @@ class MarketMaker:
         if order_id:
             self._bid_id = order_id
 
-    async def _refresh_ask(self, price: Decimal) -> None:
-        # Cancel existing ask if any
-        if self._ask_id:
-            await self._cancel(self._ask_id)
-            self._ask_id = None
+    async def _refresh_ask(self, price: Decimal, stale_id: Optional[str] = None) -> None:
+        if stale_id:
+            await self._cancel(stale_id)
 
         # Don't post a new ask if already at position limit (short)
         if self._position <= -MAX_POSITION:
@@ -246,44 +289,30 @@ class MarketMaker:
         is_buy: bool,
         reduce_only: bool = False,
     ) -> Optional[str]:
-        """Build, sign, and submit a limit order. Returns order_id or None."""
-        expiration_ns = (int(time.time()) + QUOTE_TTL_S) * 1_000_000_000
-
-        leg = OrderLeg(
-            instrument_hash=INSTRUMENT_HASH,
-            size=str(QUOTE_SIZE),
-            limit_price=str(price.quantize(Decimal("0.1"))),  # round to tick
-            is_buying_asset=is_buy,
-        )
-        order = Order(
-            sub_account_id=SUB_ACCOUNT_ID,
-            time_in_force=TimeInForce.GOOD_TILL_TIME,
-            expiration=expiration_ns,
-            legs=[leg],
-            metadata=OrderMetadata(
-                client_order_id=self._nonce() & 0xFFFF_FFFF,
-                create_time=time.time_ns(),
-            ),
-            post_only=True,      # maker-only: reject if it would match immediately
-            reduce_only=reduce_only,
-        )
-
-        chain_id = GRVTEnv[ENV.upper()].chain_id if ENV.upper() in GRVTEnv.__members__ else 326
-        sign_order(
-            order,
-            private_key=PRIVATE_KEY,
-            chain_id=chain_id,
-            verifying_contract=VERIFYING_CONTRACT,
-            nonce_provider=self._nonce,
-        )
+        """Update, sign, and submit this side's limit order. Returns order_id or None."""
+        now_ns = time.time_ns()   # one clock read for both create_time and expiry
+
+        # Safe to reuse: create_order() serialises the order before its
+        # first await, and quotes for one side never overlap.  Order,
+        # OrderLeg and OrderMetadata validate assignment, so each update
+        # below is checked just as it would be at construction.
+        order = self._bid_order if is_buy else self._ask_order
+        order.legs[0].limit_price        = str(price.quantize(_TICK))  # round to tick
+        order.expiration                 = now_ns + _QUOTE_TTL_NS
+        order.reduce_only                = reduce_only
+        order.metadata.client_order_id   = self._nonce() & 0xFFFF_FFFF
+        order.metadata.create_time       = now_ns
+
+        self._signer.sign(order)
 
         side_str = "BID" if is_buy else "ASK"
         try:
             resp = await self._client.rest.create_order(order)
-            logger.info(
-                "Placed %s %s @ %s  →  order_id=%s  status=%s",
-                side_str, QUOTE_SIZE, price, resp.order_id, resp.status.name,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Placed %s %s @ %s  →  order_id=%s  status=%s",
+                    side_str, QUOTE_SIZE, price, resp.order_id, resp.status.name,
+                )
             return resp.order_id
         except Exception as exc:
             logger.warning("Failed to place %s: %s", side_str, exc)
@@ -312,18 +341,25 @@ class MarketMaker:
         self._ask_id = None
 
     def request_shutdown(self) -> None:
-        self._shutdown.set()
+        """Stop run() by cancelling the task it runs in; cleanup happens there."""
+        if self._task is not None:
+            self._task.cancel()
 
     async def run(self) -> None:
         logger.info(
             "Starting market maker – instrument=%s  spread=%s  size=%s  max_pos=%s",
             INSTRUMENT, SPREAD, QUOTE_SIZE, MAX_POSITION,
         )
+        # Record the task first so request_shutdown() works during subscribe
+        self._task = asyncio.current_task()
 
-        # Subscribe to public market-data WS (orderbook updates)
+        # Subscribe to public market-data WS (orderbook updates).  on_book
+        # only reads the top level, so ask for depth 1 – far less JSON to
+        # decode and validate per tick than a full L10 snapshot.
         await self._client.ws.subscribe(
             f"orderbook.{INSTRUMENT}",
             self.on_book,
+            params={"depth": 1},
             msg_type=Orderbook,
         )
 
@@ -336,17 +372,11 @@ class MarketMaker:
             msg_type=Fill,
         )
 
-        # Run until shutdown is requested
-        ws_task = asyncio.create_task(self._client.ws.run_forever())
-
+        # Drive the WS loop in this task until request_shutdown() cancels it
         try:
-            await self._shutdown.wait()
+            await self._client.ws.run_forever()
         finally:
-            ws_task.cancel()
-            try:
-                await ws_task
-            except asyncio.CancelledError:
-                pass
+            # Runs on cancellation too; the CancelledError then propagates
             await self.cancel_all()
 
 
@@ -372,10 +402,20 @@ async def main() -> None:
         loop.add_signal_handler(signal.SIGINT, _on_sigint)
         loop.add_signal_handler(signal.SIGTERM, _on_sigint)
 
-        await mm.run()
+        # run() gets its own task: request_shutdown() cancels that task, and
+        # the CancelledError it re-raises ends here instead of in asyncio.run
+        runner = asyncio.ensure_future(mm.run())
+        await asyncio.wait({runner})
+        if not runner.cancelled():
+            runner.result()   # surface any error other than shutdown
 
     logger.info("Market maker stopped.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop   # optional – libuv event loop, not available on Windows
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -25,16 +25,18 @@ import asyncio
 import logging
 import os
 import time
-from typing import Any
 
 from grvt_sdk import (
     GRVTAuth,
     GRVTRestClient,
     GRVTWebSocketClient,
     Order,
+    Orderbook,
     OrderLeg,
     OrderMetadata,
+    OrderUpdate,
     TimeInForce,
+    Trade,
     sign_order,
 )
 
@@ -156,54 +158,44 @@ async def ws_demo() -> None:
 
     auth = GRVTAuth(api_key=API_KEY, env=ENV)
 
+    # Handlers receive typed models: the SDK decodes each frame once and
+    # validates msg["data"] into msg_type, so no dict probing is needed.
+
     # --- Market-data stream (public) ---
-    async def on_trade(msg: dict[str, Any]) -> None:
-        data = msg.get("data", msg)
-        logger.info(
-            "[trade]  %s  price=%s  size=%s",
-            INSTRUMENT,
-            data.get("price", "?"),
-            data.get("size",  "?"),
-        )
+    async def on_trade(trade: Trade) -> None:
+        logger.info("[trade]  %s  price=%s  size=%s", trade.instrument, trade.price, trade.size)
 
-    async def on_book(msg: dict[str, Any]) -> None:
-        data = msg.get("data", msg)
-        bids = data.get("bids", [])
-        asks = data.get("asks", [])
-        if bids and asks:
-            logger.info("[book ]  bid=%s  ask=%s", bids[0][0], asks[0][0])
+    async def on_book(book: Orderbook) -> None:
+        if book.bids and book.asks:
+            logger.info("[book ]  bid=%s  ask=%s", book.bids[0].price, book.asks[0].price)
 
     # --- Private order updates stream ---
-    async def on_order_update(msg: dict[str, Any]) -> None:
-        data = msg.get("data", msg)
-        logger.info(
-            "[order]  id=%s  status=%s",
-            data.get("order_id", "?"),
-            data.get("status",   "?"),
-        )
+    async def on_order_update(update: OrderUpdate) -> None:
+        logger.info("[order]  id=%s  status=%s", update.order_id, update.status.name)
 
     # Market-data WS (public endpoint)
     market_ws = GRVTWebSocketClient(auth, market_data=True)
-    await market_ws.subscribe(f"trades.{INSTRUMENT}", on_trade)
-    await market_ws.subscribe(f"book.{INSTRUMENT}.10", on_book)
+    await market_ws.subscribe(f"trades.{INSTRUMENT}", on_trade, msg_type=Trade)
+    await market_ws.subscribe(
+        f"orderbook.{INSTRUMENT}", on_book, params={"depth": 1}, msg_type=Orderbook,
+    )   # top of book only
 
     # Trading WS (private endpoint – order updates, fills, etc.)
     trading_ws = GRVTWebSocketClient(auth, market_data=False)
-    await trading_ws.subscribe("orders", on_order_update)
-
-    # Run both for 15 seconds then exit
-    async def run_ws(ws: GRVTWebSocketClient) -> None:
-        try:
-            await asyncio.wait_for(ws.run_forever(), timeout=15)
-        except asyncio.TimeoutError:
-            pass
-        finally:
-            await ws.close()
-
-    await asyncio.gather(
-        run_ws(market_ws),
-        run_ws(trading_ws),
-    )
+    await trading_ws.subscribe("orders", on_order_update, msg_type=OrderUpdate)
+
+    # Market data and private streams live on separate GRVT endpoints, so
+    # two connections are needed; they share one TLS context inside the SDK
+    # and one 15 s timer here.
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(market_ws.run_forever(), trading_ws.run_forever()),
+            timeout=15,
+        )
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await asyncio.gather(market_ws.close(), trading_ws.close())
     logger.info("WebSocket demo complete")
 
 
@@ -3,7 +3,7 @@ GRVT SDK – Python SDK for GRVT Exchange.
 
 Provides:
   - Unified façade                     (client.py  → GRVTClient)
-  - EIP-712 order signing              (signing.py → sign_order)
+  - EIP-712 order signing              (signing.py → sign_order, sign_orders, OrderSigner)
   - Session authentication             (auth.py    → GRVTAuth)
   - Typed Pydantic v2 models           (types.py)
   - Synchronous REST client            (rest.py    → GRVTRestClient)
@@ -24,43 +24,124 @@ Quickstart
     asyncio.run(main())
 """
 
-from .types import (
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names are resolved lazily (PEP 562): ``import grvt_sdk`` stays cheap,
+# and pydantic / aiohttp / requests / websockets load only when a name that
+# needs them is first accessed.  Maps each public name to its submodule.
+_LAZY: dict[str, str] = {
     # Environment
-    GRVTEnv,
+    "GRVTEnv":                 "types",
     # Enums
-    Side,
-    TimeInForce,
-    OrderStatus,
-    KindEnum,
+    "Side":                    "types",
+    "TimeInForce":             "types",
+    "OrderStatus":             "types",
+    "KindEnum":                "types",
     # Core objects
-    Instrument,
-    OrderLeg,
-    OrderMetadata,
-    Order,
+    "Instrument":              "types",
+    "OrderLeg":                "types",
+    "OrderMetadata":           "types",
+    "Order":                   "types",
     # Request / response envelopes
-    CreateOrderRequest,
-    CreateOrderResponse,
-    CancelOrderRequest,
-    CancelOrderResponse,
-    CancelAllOrdersResponse,
-    OpenOrdersRequest,
-    OpenOrdersResponse,
+    "CreateOrderRequest":      "types",
+    "CreateOrderResponse":     "types",
+    "CancelOrderRequest":      "types",
+    "CancelOrderResponse":     "types",
+    "CancelAllOrdersResponse": "types",
+    "OpenOrdersRequest":       "types",
+    "OpenOrdersResponse":      "types",
     # Market data
-    OrderbookLevel,
-    Orderbook,
-    Trade,
+    "OrderbookLevel":          "types",
+    "Orderbook":               "types",
+    "Trade":                   "types",
     # Private WS push events
-    Fill,
-    OrderUpdate,
+    "Fill":                    "types",
+    "OrderUpdate":             "types",
     # Account
-    Position,
-    AccountSummary,
-)
-from .signing import sign_order, recover_signer, build_eip712_domain, NonceProvider
-from .auth import GRVTAuth
-from .rest import GRVTRestClient, AsyncGRVTRestClient, GRVTAPIError
-from .ws import GRVTWebSocketClient, make_ws_client
-from .client import GRVTClient
+    "Position":                "types",
+    "AccountSummary":          "types",
+    # Signing
+    "sign_order":              "signing",
+    "sign_orders":             "signing",
+    "recover_signer":          "signing",
+    "build_eip712_domain":     "signing",
+    "NonceProvider":           "signing",
+    "SequenceNonce":           "signing",
+    "OrderSigner":             "signing",
+    "make_signer":             "signing",
+    # Auth
+    "GRVTAuth":                "auth",
+    # REST
+    "GRVTRestClient":          "rest",
+    "AsyncGRVTRestClient":     "rest",
+    "GRVTAPIError":            "rest",
+    "CancelCoalescer":         "rest",
+    "AsyncClientPool":         "rest",
+    # WebSocket
+    "GRVTWebSocketClient":     "ws",
+    "make_ws_client":          "ws",
+    # Unified façade
+    "GRVTClient":              "client",
+}
+
+if TYPE_CHECKING:
+    from .types import (
+        GRVTEnv,
+        Side,
+        TimeInForce,
+        OrderStatus,
+        KindEnum,
+        Instrument,
+        OrderLeg,
+        OrderMetadata,
+        Order,
+        CreateOrderRequest,
+        CreateOrderResponse,
+        CancelOrderRequest,
+        CancelOrderResponse,
+        CancelAllOrdersResponse,
+        OpenOrdersRequest,
+        OpenOrdersResponse,
+        OrderbookLevel,
+        Orderbook,
+        Trade,
+        Fill,
+        OrderUpdate,
+        Position,
+        AccountSummary,
+    )
+    from .signing import (
+        sign_order,
+        sign_orders,
+        recover_signer,
+        build_eip712_domain,
+        NonceProvider,
+        SequenceNonce,
+        OrderSigner,
+        make_signer,
+    )
+    from .auth import GRVTAuth
+    from .rest import GRVTRestClient, AsyncGRVTRestClient, GRVTAPIError, CancelCoalescer, AsyncClientPool
+    from .ws import GRVTWebSocketClient, make_ws_client
+    from .client import GRVTClient
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value   # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Environment
@@ -95,15 +176,21 @@ __all__ = [
     "AccountSummary",
     # Signing
     "sign_order",
+    "sign_orders",
     "recover_signer",
     "build_eip712_domain",
     "NonceProvider",
+    "SequenceNonce",
+    "OrderSigner",
+    "make_signer",
     # Auth
     "GRVTAuth",
     # REST
     "GRVTRestClient",
     "AsyncGRVTRestClient",
     "GRVTAPIError",
+    "CancelCoalescer",
+    "AsyncClientPool",
     # WebSocket
     "GRVTWebSocketClient",
     "make_ws_client",
@@ -0,0 +1,40 @@
+"""
+_json.py – JSON codec shared by the SDK's hot paths.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so the fast path is strictly opt-in:
+
+    pip install "grvt-sdk[fast]"
+
+orjson decodes straight from the wire bytes/str in C and is several times
+faster than json.loads on orderbook-sized payloads.  Its JSONDecodeError
+subclasses json.JSONDecodeError, so callers only ever need to catch the
+stdlib exception.
+
+dumps() always returns compact UTF-8 bytes (orjson's native output), ready
+to send as a request body.
+"""
+
+from __future__ import annotations
+
+import json
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    from orjson import dumps, loads
+
+    HAS_ORJSON = True
+except ImportError:                                  # pragma: no cover – depends on env
+    from json import loads  # type: ignore[assignment]
+
+    HAS_ORJSON = False
+
+    # Picked once at import, so the orjson path is a direct C call with no
+    # per-call backend check.
+    def dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Serialise ``obj`` to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+__all__ = ["HAS_ORJSON", "JSONDecodeError", "dumps", "loads"]
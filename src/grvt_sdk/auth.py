@@ -19,18 +19,29 @@ Usage
 
     # Async: await cookie (safe to call concurrently – Lock prevents races)
     cookie = await auth.async_get_cookie()
+
+    # Async, logging in over an existing aiohttp.ClientSession so the login
+    # reuses its pooled keep-alive connections (AsyncGRVTRestClient does this)
+    cookie = await auth.async_get_cookie(session=http_session)
+
+    # Async logins without a session share one pooled aiohttp session;
+    # close it on shutdown (GRVTClient.close() and GRVTWebSocketClient.close() do this)
+    await auth.aclose()
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from . import _json
 from .types import GRVTEnv
 
 logger = logging.getLogger(__name__)
@@ -39,28 +50,37 @@ logger = logging.getLogger(__name__)
 # Environment base URLs
 # ---------------------------------------------------------------------------
 
-_ENDPOINTS: dict[str, dict[str, str]] = {
-    "testnet": {
-        "edge":      "https://edge.testnet.grvt.io",
-        "rest":      "https://trades.testnet.grvt.io",
-        "market":    "https://market-data.testnet.grvt.io",
-        "ws_trades": "wss://trades.testnet.grvt.io/ws",
-        "ws_market": "wss://market-data.testnet.grvt.io/ws",
-    },
-    "mainnet": {
-        "edge":      "https://edge.grvt.io",
-        "rest":      "https://trades.grvt.io",
-        "market":    "https://market-data.grvt.io",
-        "ws_trades": "wss://trades.grvt.io/ws",
-        "ws_market": "wss://market-data.grvt.io/ws",
-    },
-    "dev": {
-        "edge":      "https://edge.dev.gravitymarkets.io",
-        "rest":      "https://trades.dev.gravitymarkets.io",
-        "market":    "https://market-data.dev.gravitymarkets.io",
-        "ws_trades": "wss://trades.dev.gravitymarkets.io/ws",
-        "ws_market": "wss://market-data.dev.gravitymarkets.io/ws",
-    },
+@dataclass(frozen=True, slots=True)
+class _Endpoints:
+    edge:      str
+    rest:      str
+    market:    str
+    ws_trades: str
+    ws_market: str
+
+
+_ENDPOINTS: dict[str, _Endpoints] = {
+    "testnet": _Endpoints(
+        edge="https://edge.testnet.grvt.io",
+        rest="https://trades.testnet.grvt.io",
+        market="https://market-data.testnet.grvt.io",
+        ws_trades="wss://trades.testnet.grvt.io/ws",
+        ws_market="wss://market-data.testnet.grvt.io/ws",
+    ),
+    "mainnet": _Endpoints(
+        edge="https://edge.grvt.io",
+        rest="https://trades.grvt.io",
+        market="https://market-data.grvt.io",
+        ws_trades="wss://trades.grvt.io/ws",
+        ws_market="wss://market-data.grvt.io/ws",
+    ),
+    "dev": _Endpoints(
+        edge="https://edge.dev.gravitymarkets.io",
+        rest="https://trades.dev.gravitymarkets.io",
+        market="https://market-data.dev.gravitymarkets.io",
+        ws_trades="wss://trades.dev.gravitymarkets.io/ws",
+        ws_market="wss://market-data.dev.gravitymarkets.io/ws",
+    ),
 }
 
 # Path used to exchange an API key for a session cookie
@@ -69,32 +89,109 @@ _LOGIN_PATH = "/auth/api_key/login"
 # Cookie name returned by GRVT's auth service
 _COOKIE_NAME = "exchange_token"
 
+# Login request bodies are pre-encoded JSON bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 # How many seconds before expiry to proactively refresh (5 minutes)
 _REFRESH_BUFFER_S = 300
 
+# Connection-pool tuning shared by every HTTP session the SDK opens (the
+# sync requests pools here and in rest.py, and the aiohttp connectors), so
+# sync and async callers get the same keep-alive behaviour per host.
+_POOL_LIMIT          = 100   # total open connections per aiohttp connector
+_POOL_LIMIT_PER_HOST = 20    # sockets kept open per host, for concurrent fan-out
+_KEEPALIVE_S         = 30
+_DNS_CACHE_TTL_S     = 300
+
+# Keep-alive pool for the sync requests.Session
+_SYNC_POOL_HOSTS   = 4    # per-host pools kept: edge, trades, market-data + spare
+_SYNC_POOL_MAXSIZE = _POOL_LIMIT_PER_HOST
+
+
+def _cookie_from_body(raw: bytes) -> str:
+    """
+    Fallback when the login response sets no cookie: read the session token
+    from the JSON body ("cookie" or "token").  Returns "" if there is none.
+    """
+    try:
+        body = _json.loads(raw)
+    except _json.JSONDecodeError:
+        return ""
+    if not isinstance(body, dict):
+        return ""
+    token: str = body.get("cookie") or body.get("token") or ""
+    return token
+
+
+def _pooled_session() -> requests.Session:
+    """
+    requests.Session with a keep-alive pool sized for concurrent callers.
+
+    The default adapter keeps one socket per host, so concurrent callers
+    sharing a session would each open (and then drop) a fresh TCP + TLS
+    connection.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=_SYNC_POOL_HOSTS,
+        pool_maxsize=_SYNC_POOL_MAXSIZE,
+    ))
+    return session
+
+
+def _async_connector(limit: int = _POOL_LIMIT) -> Any:
+    """
+    aiohttp.TCPConnector with the shared keep-alive and DNS-cache settings.
+
+    Must be called with a running event loop (aiohttp binds the connector
+    to it).
+    """
+    import aiohttp  # lazy import – only needed for async usage
+
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=_KEEPALIVE_S,
+        ttl_dns_cache=_DNS_CACHE_TTL_S,
+    )
+
+
+# Label → enum, for resolving string environments with one dict lookup
+_ENV_BY_LABEL: dict[str, GRVTEnv] = {env.label: env for env in GRVTEnv}
+
 
-def _env_label(env: Union[GRVTEnv, str]) -> str:
-    """Normalise a GRVTEnv enum or string to a lowercase label key."""
+def _as_env(env: Union[GRVTEnv, str]) -> GRVTEnv:
+    """Normalise a GRVTEnv enum or a case-insensitive name ("testnet") to GRVTEnv."""
     if isinstance(env, GRVTEnv):
-        return env.label
-    return env.lower()
+        return env
+    resolved = _ENV_BY_LABEL.get(env.lower())
+    if resolved is None:
+        raise ValueError(
+            f"Unknown GRVT environment {env!r}; expected one of {', '.join(_ENV_BY_LABEL)}"
+        )
+    return resolved
 
 
 # ---------------------------------------------------------------------------
 # Internal state
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _SessionState:
     cookie_value: str
     expires_at:   float   # monotonic clock timestamp
+    refresh_at:   float = field(init=False)   # expires_at - refresh buffer
+
+    def __post_init__(self) -> None:
+        # Precomputed so the per-request validity check is one comparison
+        self.refresh_at = self.expires_at - _REFRESH_BUFFER_S
 
 
 # ---------------------------------------------------------------------------
 # Auth manager
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, init=False)
 class GRVTAuth:
     """
     Manages GRVT API key → session cookie authentication.
@@ -103,51 +200,91 @@ class GRVTAuth:
     ----------
     api_key     : GRVT API key (created in the exchange web UI)
     env         : GRVTEnv.TESTNET / GRVTEnv.MAINNET / GRVTEnv.DEV,
-                  or the equivalent strings "testnet" / "mainnet" / "dev"
+                  or the equivalent strings "testnet" / "mainnet" / "dev".
+                  Strings are normalised, so ``auth.env`` is always a GRVTEnv.
     ttl_seconds : Expected cookie TTL from the server.  Used to schedule
                   proactive refresh.  Defaults to 86400 (24 h).
 
     Thread / async safety
     ---------------------
-    Sync path is single-threaded (protect externally if needed).
+    Sync re-auth is serialised by a threading.Lock, so worker threads
+    sharing one GRVTAuth (e.g. ``GRVTRestClient.create_orders``) log in
+    at most once per refresh; the valid-cookie fast path takes no lock.
     Async path uses an asyncio.Lock to prevent concurrent re-auth races.
+    The lock is created on first async use, inside the running loop, so a
+    GRVTAuth can be constructed anywhere – including before any loop exists.
     """
 
     api_key:     str
-    env:         Union[GRVTEnv, str] = GRVTEnv.TESTNET
-    ttl_seconds: float               = 86_400.0
-
-    _state:     Optional[_SessionState]  = field(default=None, init=False, repr=False)
-    _session:   Optional[requests.Session] = field(default=None, init=False, repr=False)
-    _async_lock: asyncio.Lock            = field(default_factory=asyncio.Lock, init=False, repr=False)
+    env:         GRVTEnv
+    ttl_seconds: float
+
+    _state:     Optional[_SessionState]  = field(init=False, repr=False)
+    _session:   Optional[requests.Session] = field(init=False, repr=False)
+    _async_lock: Optional[asyncio.Lock]  = field(init=False, repr=False)   # created on first async use
+    _sync_lock:  threading.Lock          = field(init=False, repr=False, compare=False)
+    _aiohttp_session: Optional[Any]      = field(init=False, repr=False)   # aiohttp.ClientSession, created on first use
+    # Resolved URLs, one slot each (cached_property needs a __dict__)
+    _edge_url:      str                  = field(init=False, repr=False)
+    _base_url:      str                  = field(init=False, repr=False)
+    _market_url:    str                  = field(init=False, repr=False)
+    _ws_trades_url: str                  = field(init=False, repr=False)
+    _ws_market_url: str                  = field(init=False, repr=False)
+    _login_url: str                      = field(init=False, repr=False)
+    _login_body: bytes                   = field(init=False, repr=False)
+
+    def __init__(
+        self,
+        api_key:     str,
+        env:         Union[GRVTEnv, str] = GRVTEnv.TESTNET,
+        ttl_seconds: float               = 86_400.0,
+    ) -> None:
+        # Written out rather than generated so ``env`` can accept a string
+        # while the stored field is always a GRVTEnv.
+        self.api_key          = api_key
+        self.env              = _as_env(env)
+        self.ttl_seconds      = ttl_seconds
+        self._state           = None
+        self._session         = None
+        self._async_lock      = None
+        self._sync_lock       = threading.Lock()
+        self._aiohttp_session = None
+
+        # env and api_key are fixed for the lifetime of the instance, so
+        # resolve every URL and build the login request once instead of
+        # on every URL access / re-authentication.
+        endpoints           = _ENDPOINTS[self.env.label]
+        self._edge_url      = endpoints.edge
+        self._base_url      = endpoints.rest
+        self._market_url    = endpoints.market
+        self._ws_trades_url = endpoints.ws_trades
+        self._ws_market_url = endpoints.ws_market
+        self._login_url     = self._edge_url + _LOGIN_PATH
+        self._login_body    = _json.dumps({"api_key": self.api_key})
 
     # ------------------------------------------------------------------
     # URL properties
     # ------------------------------------------------------------------
 
-    @property
-    def _endpoints(self) -> dict[str, str]:
-        return _ENDPOINTS[_env_label(self.env)]
-
     @property
     def edge_url(self) -> str:
-        return self._endpoints["edge"]
+        return self._edge_url
 
     @property
     def base_url(self) -> str:
-        return self._endpoints["rest"]
+        return self._base_url
 
     @property
     def market_url(self) -> str:
-        return self._endpoints["market"]
+        return self._market_url
 
     @property
     def ws_trades_url(self) -> str:
-        return self._endpoints["ws_trades"]
+        return self._ws_trades_url
 
     @property
     def ws_market_url(self) -> str:
-        return self._endpoints["ws_market"]
+        return self._ws_market_url
 
     # ------------------------------------------------------------------
     # Sync public API
@@ -155,15 +292,17 @@ class GRVTAuth:
 
     def get_session(self) -> requests.Session:
         """Return a requests.Session with a valid auth cookie, re-authing if needed."""
-        self._ensure_authenticated()
-        assert self._session is not None
-        return self._session
+        # The session may not exist yet if only the async path has logged in
+        if self._session is None or not self._is_valid():
+            with self._sync_lock:
+                # Re-check: another thread may have logged in meanwhile
+                if self._session is None or not self._is_valid():
+                    self._authenticate()
+        return self._http_session()
 
     def get_cookie(self) -> str:
         """Return the raw session cookie value, refreshing if needed."""
-        self._ensure_authenticated()
-        assert self._state is not None
-        return self._state.cookie_value
+        return self._ensure_authenticated().cookie_value
 
     def invalidate(self) -> None:
         """Force re-authentication on the next request."""
@@ -179,58 +318,89 @@ class GRVTAuth:
     # Async public API
     # ------------------------------------------------------------------
 
-    async def async_get_cookie(self) -> str:
+    async def async_get_cookie(self, session: Optional[Any] = None) -> str:
         """
         Async version of get_cookie().
 
         Uses an asyncio.Lock to prevent concurrent coroutines from
         triggering duplicate re-auth requests (double-refresh race).
 
+        Parameters
+        ----------
+        session : Optional aiohttp.ClientSession to send the login request
+                  on, so a re-auth reuses its pooled connections.  If
+                  omitted, the login uses a session owned by this
+                  GRVTAuth (created on first use, closed by ``aclose()``).
+
         Returns the cookie value.  Requires aiohttp to be installed.
         """
-        if self._is_valid():
-            assert self._state is not None
-            return self._state.cookie_value
-
-        async with self._async_lock:
+        state = self._state
+        if state is not None and time.monotonic() < state.refresh_at:
+            return state.cookie_value
+
+        lock = self._async_lock
+        if lock is None:
+            lock = self._async_lock = asyncio.Lock()
+        async with lock:
             # Re-check after acquiring lock – another coroutine may have
             # refreshed while we were waiting.
-            if self._is_valid():
-                assert self._state is not None
-                return self._state.cookie_value
+            state = self._state
+            if state is not None and time.monotonic() < state.refresh_at:
+                return state.cookie_value
 
-            await self._async_authenticate()
-            assert self._state is not None
-            return self._state.cookie_value
+            state = await self._async_authenticate(session)
+            return state.cookie_value
 
     async def async_cookies_dict(self) -> dict[str, str]:
         """Async version of cookies_dict()."""
         return {_COOKIE_NAME: await self.async_get_cookie()}
 
+    def close(self) -> None:
+        """Close the pooled connections of the sync requests.Session, if any."""
+        if self._session is not None:
+            self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session used for logins without a caller session."""
+        if self._aiohttp_session and not self._aiohttp_session.closed:
+            await self._aiohttp_session.close()
+        self._aiohttp_session = None
+
     # ------------------------------------------------------------------
     # Internal sync helpers
     # ------------------------------------------------------------------
 
     def _is_valid(self) -> bool:
-        if self._state is None:
-            return False
-        return time.monotonic() < self._state.expires_at - _REFRESH_BUFFER_S
-
-    def _ensure_authenticated(self) -> None:
-        if not self._is_valid():
-            self._authenticate()
-
-    def _authenticate(self) -> None:
-        """POST to GRVT login endpoint and store the returned cookie."""
-        url = self.edge_url + _LOGIN_PATH
-        logger.debug("Authenticating with GRVT at %s", url)
-
-        if self._session is None:
-            self._session = requests.Session()
-
-        resp = self._session.post(
+        state = self._state
+        return state is not None and time.monotonic() < state.refresh_at
+
+    def _ensure_authenticated(self) -> _SessionState:
+        """Return the current session state, re-authenticating if it is stale."""
+        state = self._state
+        if state is None or time.monotonic() >= state.refresh_at:
+            with self._sync_lock:
+                state = self._state
+                if state is None or time.monotonic() >= state.refresh_at:
+                    state = self._authenticate()
+        return state
+
+    def _http_session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            session = self._session = _pooled_session()
+        return session
+
+    def _authenticate(self) -> _SessionState:
+        """POST to GRVT login endpoint, store the returned cookie and return the new state."""
+        url = self._login_url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Authenticating with GRVT at %s", url)
+
+        session = self._http_session()
+        resp    = session.post(
             url,
-            json={"api_key": self.api_key},
+            data=self._login_body,
+            headers=_JSON_HEADERS,
             timeout=10,
         )
 
@@ -242,11 +412,8 @@ class GRVTAuth:
                 f"POST {url}: {resp.text}"
             ) from exc
 
-        cookie = self._session.cookies.get(_COOKIE_NAME)
-        if not cookie:
-            body   = resp.json()
-            cookie = body.get("cookie") or body.get("token")
-
+        # The body is only parsed when the server did not set the cookie
+        cookie = session.cookies.get(_COOKIE_NAME) or _cookie_from_body(resp.content)
         if not cookie:
             raise RuntimeError(
                 f"GRVT login succeeded but no '{_COOKIE_NAME}' cookie found. "
@@ -254,43 +421,63 @@ class GRVTAuth:
             )
 
         expires_at = time.monotonic() + self.ttl_seconds
-        self._state = _SessionState(cookie_value=cookie, expires_at=expires_at)
-        logger.info("GRVT session authenticated, expires in %.0f s", self.ttl_seconds)
+        state = self._state = _SessionState(cookie_value=cookie, expires_at=expires_at)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("GRVT session authenticated, expires in %.0f s", self.ttl_seconds)
+        return state
 
     # ------------------------------------------------------------------
     # Internal async helpers
     # ------------------------------------------------------------------
 
-    async def _async_authenticate(self) -> None:
-        """Async POST to GRVT login endpoint and store the returned cookie."""
+    async def _async_authenticate(self, session: Optional[Any] = None) -> _SessionState:
+        """Async POST to GRVT login endpoint, store the returned cookie and return the new state."""
         import aiohttp  # lazy import – only needed for async usage
 
-        url = self.edge_url + _LOGIN_PATH
-        logger.debug("Async authenticating with GRVT at %s", url)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                json={"api_key": self.api_key},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status >= 400:
-                    body = await resp.text()
-                    raise RuntimeError(
-                        f"GRVT async authentication failed [{resp.status}] "
-                        f"POST {url}: {body}"
-                    )
-
-                cookie_obj = resp.cookies.get(_COOKIE_NAME)
-                if cookie_obj:
-                    cookie_value = cookie_obj.value
-                else:
-                    body_json    = await resp.json()
-                    cookie_value = body_json.get("cookie") or body_json.get("token") or ""
+        url = self._login_url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Async authenticating with GRVT at %s", url)
+
+        if session is None:
+            # Called under the async lock, so at most one session is created;
+            # later refreshes reuse its keep-alive connection to the edge host.
+            if self._aiohttp_session is None or self._aiohttp_session.closed:
+                # Logins only reach the edge host: a small pool is enough
+                self._aiohttp_session = aiohttp.ClientSession(
+                    connector=_async_connector(limit=_SYNC_POOL_HOSTS),
+                )
+            session = self._aiohttp_session
+
+        cookie_value = await self._async_login(session, url)
 
         if not cookie_value:
             raise RuntimeError("GRVT async login: no session cookie in response")
 
-        expires_at   = time.monotonic() + self.ttl_seconds
-        self._state  = _SessionState(cookie_value=cookie_value, expires_at=expires_at)
-        logger.info("GRVT async session authenticated, expires in %.0f s", self.ttl_seconds)
+        expires_at = time.monotonic() + self.ttl_seconds
+        state = self._state = _SessionState(cookie_value=cookie_value, expires_at=expires_at)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("GRVT async session authenticated, expires in %.0f s", self.ttl_seconds)
+        return state
+
+    async def _async_login(self, session: Any, url: str) -> str:
+        """Send the login request on ``session``; return the cookie value or ""."""
+        import aiohttp
+
+        async with session.post(
+            url,
+            data=self._login_body,
+            headers=_JSON_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            if resp.status >= 400:
+                body = await resp.text()
+                raise RuntimeError(
+                    f"GRVT async authentication failed [{resp.status}] "
+                    f"POST {url}: {body}"
+                )
+
+            cookie_obj = resp.cookies.get(_COOKIE_NAME)
+            if cookie_obj:
+                cookie_value: str = cookie_obj.value
+                return cookie_value
+            return _cookie_from_body(await resp.read())
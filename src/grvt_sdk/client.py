@@ -76,9 +76,10 @@ class GRVTClient:
         await self.close()
 
     async def close(self) -> None:
-        """Cleanly close the REST session and the WebSocket connection."""
+        """Cleanly close the REST session, the WebSocket connection and the auth session."""
         await self.rest.close()
         await self.ws.close()
+        await self._auth.aclose()
 
     # ------------------------------------------------------------------
     # Convenience: direct access to the shared auth object
@@ -90,5 +91,5 @@ class GRVTClient:
         return self._auth
 
     @property
-    def env(self) -> Union[GRVTEnv, str]:
+    def env(self) -> GRVTEnv:
         return self._auth.env
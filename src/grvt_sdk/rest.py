@@ -10,11 +10,10 @@ Usage – sync
 ------------
     from grvt_sdk import GRVTRestClient, GRVTAuth, GRVTEnv
 
-    auth   = GRVTAuth(api_key="...", env=GRVTEnv.TESTNET)
-    client = GRVTRestClient(auth=auth)
-
-    sign_order(order, private_key, GRVTEnv.TESTNET.chain_id, contract)
-    response = client.create_order(order)
+    auth = GRVTAuth(api_key="...", env=GRVTEnv.TESTNET)
+    with GRVTRestClient(auth=auth) as client:
+        sign_order(order, private_key, GRVTEnv.TESTNET.chain_id, contract)
+        response = client.create_order(order)
 
 Usage – async
 -------------
@@ -27,12 +26,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
-from typing import Any, Optional
-
-import requests
-
-from .auth import GRVTAuth
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+from . import _json
+from .auth import (
+    _JSON_HEADERS,
+    _POOL_LIMIT_PER_HOST,
+    GRVTAuth,
+    _async_connector,
+    _pooled_session,
+)
 from .types import (
     AccountSummary,
     CancelAllOrdersResponse,
@@ -41,22 +53,67 @@ from .types import (
     Instrument,
     KindEnum,
     Order,
+    OrderLeg,
     OrderStatus,
     Orderbook,
     Side,
     Trade,
+    _DecimalStr,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self  # typing.Self needs Python 3.11
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Retry configuration
 # ---------------------------------------------------------------------------
 
-_RETRY_STATUSES  = {429, 500, 502, 503, 504}
-_MAX_RETRIES     = 3
-_RETRY_BASE_S    = 0.5   # initial back-off seconds
-_RETRY_EXP       = 2.0
+_RETRY_STATUSES  = frozenset({429, 500, 502, 503, 504})
+_RETRY_DELAYS    = (0.5, 1.0, 2.0)   # escalating base delay per retry, seconds
+_MAX_RETRIES     = len(_RETRY_DELAYS)
+_RETRY_JITTER_S  = 0.1               # random extra delay, spreads out concurrent retries
+_RETRY_AFTER_MAX_S = 30.0            # cap on a server-advised Retry-After
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """
+    Seconds to wait before retry number ``attempt + 1``.
+
+    The base schedule escalates through _RETRY_DELAYS; a Retry-After header
+    (delta-seconds or HTTP-date) raises it to the server-advised wait,
+    capped at _RETRY_AFTER_MAX_S.  Jitter is always added.
+    """
+    delay = _RETRY_DELAYS[attempt]
+    if retry_after:
+        try:
+            advised = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                advised = 0.0
+            else:
+                # HTTP-dates are GMT; a zone-less one must not be read as local time
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                advised = when.timestamp() - time.time()
+        delay = max(delay, min(advised, _RETRY_AFTER_MAX_S))
+    return delay + random.uniform(0.0, _RETRY_JITTER_S)
+
+
+# ---------------------------------------------------------------------------
+# Async connection pool
+# ---------------------------------------------------------------------------
+
+# One pooled connector per AsyncGRVTRestClient, shared by REST calls and
+# re-auth logins, so keep-alive sockets and resolved DNS entries are reused.
+# Its limits are the SDK-wide ones in auth.py (_async_connector).
+
+# Default in-flight cap for the batch helpers (create_orders, ...), sync and
+# async; matches the per-host pool so a batch never queues on the connector.
+_MAX_INFLIGHT = _POOL_LIMIT_PER_HOST
 
 
 # ---------------------------------------------------------------------------
@@ -79,21 +136,32 @@ class GRVTAPIError(Exception):
 # Serialisation helpers (shared by sync and async clients)
 # ---------------------------------------------------------------------------
 
+# Whole-list adapter, built once: one call into pydantic-core per list
+# instead of one model_dump() per leg.
+_LEG_LIST: TypeAdapter[list[OrderLeg]] = TypeAdapter(list[OrderLeg])
+
+
 def _order_to_dict(order: Order) -> dict[str, Any]:
     """Serialise an Order to the JSON body expected by GRVT."""
+    legs = order.legs
+    if len(legs) == 1:
+        # Single-leg orders are the common case: read the four fields directly.
+        leg       = legs[0]
+        leg_dicts = [{
+            "instrument":      leg.instrument_hash,
+            "size":            leg.size,
+            "limit_price":     leg.limit_price,
+            "is_buying_asset": leg.is_buying_asset,
+        }]
+    else:
+        # Multi-leg orders go through pydantic-core's compiled serializer in
+        # one call; the by-alias leg shape is exactly the API's.
+        leg_dicts = _LEG_LIST.dump_python(legs, by_alias=True)
     return {
         "sub_account_id": str(order.sub_account_id),
         "time_in_force":  int(order.time_in_force),
         "expiration":     str(order.expiration),
-        "legs": [
-            {
-                "instrument":      leg.instrument_hash,
-                "size":            leg.size,
-                "limit_price":     leg.limit_price,
-                "is_buying_asset": leg.is_buying_asset,
-            }
-            for leg in order.legs
-        ],
+        "legs":           leg_dicts,
         "metadata": {
             "client_order_id": order.metadata.client_order_id,
             "create_time":     str(order.metadata.create_time),
@@ -102,32 +170,145 @@ def _order_to_dict(order: Order) -> dict[str, Any]:
     }
 
 
+def _with_filters(
+    body:  dict[str, Any],
+    kind:  Optional[KindEnum],
+    base:  Optional[str],
+    quote: Optional[str],
+) -> dict[str, Any]:
+    """Add the optional kind / base / quote filters to a list-endpoint body."""
+    if kind is not None:
+        body["kind"] = [int(kind)]
+    if base is not None:
+        body["base"] = [base]
+    if quote is not None:
+        body["quote"] = [quote]
+    return body
+
+
+def _parse_create_response(raw: dict[str, Any]) -> CreateOrderResponse:
+    """Deserialise a /full/v1/order response (with or without the "result" wrapper)."""
+    result = raw.get("result", raw)
+    # status stays a plain int: the model's compiled enum validator maps it
+    # to OrderStatus without a Python-level Enum.__call__.
+    return CreateOrderResponse.model_validate({
+        "order_id": result["order_id"],
+        "status":   int(result.get("status", OrderStatus.OPEN)),
+        "reason":   result.get("reason"),
+    })
+
+
 def _parse_order(raw: dict[str, Any]) -> Order:
     """Deserialise a raw API dict into an Order via Pydantic validation."""
-    # API uses "instrument" key for legs; our model uses "instrument_hash"
-    normalised = dict(raw)
-    normalised["legs"] = [
-        {**leg, "instrument_hash": leg.pop("instrument", leg.get("instrument_hash", ""))}
-        for leg in raw.get("legs", [])
+    # The API's leg "instrument" key maps to OrderLeg.instrument_hash via
+    # its validation alias, so the raw dict is validated as-is.
+    return Order.model_validate(raw)
+
+
+class _OrdersResult(BaseModel):
+    open_orders: list[Order] = []   # /full/v1/open_orders
+    orders:      list[Order] = []   # /full/v1/order_history
+
+
+class _OrdersEnvelope(BaseModel):
+    """{"result": {...}} body of the order-list endpoints; other keys are ignored."""
+    result: _OrdersResult = _OrdersResult()
+
+
+def _parse_orders_json(content: bytes) -> _OrdersResult:
+    """
+    Validate an order-list response straight from the wire bytes.
+
+    pydantic-core walks the JSON array natively, with no intermediate
+    Python dicts for the orders.
+    """
+    return _OrdersEnvelope.model_validate_json(content).result
+
+
+class _InstrumentsResult(BaseModel):
+    instruments: list[Instrument] = []
+
+
+class _InstrumentsEnvelope(BaseModel):
+    """{"result": {"instruments": [...]}} body of /full/v1/instruments."""
+    result: _InstrumentsResult = _InstrumentsResult()
+
+
+def _parse_instruments_json(content: bytes) -> list[Instrument]:
+    """
+    Validate the (large) instrument list straight from the wire bytes, like
+    _parse_orders_json: no intermediate dict per instrument.
+    """
+    return _InstrumentsEnvelope.model_validate_json(content).result.instruments
+
+
+class _RestTrade(BaseModel):
+    """One REST trade: keyed differently from Trade and without an instrument."""
+    trade_id:       str
+    price:          _DecimalStr
+    size:           _DecimalStr
+    is_taker_buyer: bool
+    created_time:   int
+
+
+class _TradesResult(BaseModel):
+    trades: list[_RestTrade] = []
+
+
+class _TradesEnvelope(BaseModel):
+    """{"result": {"trades": [...]}} body of /full/v1/trades."""
+    result: _TradesResult = _TradesResult()
+
+
+def _parse_trades_json(instrument: str, content: bytes) -> list[Trade]:
+    """
+    Validate the REST trades list straight from the wire bytes, then map
+    each one onto the public Trade.  The fields are already validated, so
+    Trade is built with model_construct() rather than validated twice.
+    """
+    return [
+        Trade.model_construct(
+            trade_id=t.trade_id,
+            instrument=instrument,
+            price=t.price,
+            size=t.size,
+            side=Side.BUY if t.is_taker_buyer else Side.SELL,
+            timestamp=t.created_time,
+        )
+        for t in _TradesEnvelope.model_validate_json(content).result.trades
     ]
-    return Order.model_validate(normalised)
 
 
 def _parse_orderbook(instrument: str, result: dict[str, Any]) -> Orderbook:
+    # Both sides' levels are built by pydantic-core inside this one call.
     return Orderbook.model_validate({"instrument": instrument, **result})
 
 
+# Values for the optional account fields the API may omit; merged under the
+# response in one C-level dict build.  Validation copies "positions", so the
+# shared list is never handed out.
+_ACCT_DEFAULTS: dict[str, Any] = {
+    "total_equity":       "0",
+    "available_margin":   "0",
+    "initial_margin":     "0",
+    "maintenance_margin": "0",
+    "positions":          [],
+}
+
+
 def _parse_account_summary(sub_account_id: int, result: dict[str, Any]) -> AccountSummary:
-    # Fill defaults for optional fields the API may omit
-    normalised = {
-        "sub_account_id":     sub_account_id,
-        "total_equity":       result.get("total_equity", "0"),
-        "available_margin":   result.get("available_margin", "0"),
-        "initial_margin":     result.get("initial_margin", "0"),
-        "maintenance_margin": result.get("maintenance_margin", "0"),
-        "positions":          result.get("positions", []),
-    }
-    return AccountSummary.model_validate(normalised)
+    # Unknown response keys are ignored by the model
+    return AccountSummary.model_validate(
+        {**_ACCT_DEFAULTS, **result, "sub_account_id": sub_account_id}
+    )
+
+
+def _cache_url(
+    urls: dict[tuple[bool, str], str], auth: GRVTAuth, public: bool, path: str,
+) -> str:
+    """Build the absolute URL for ``path`` and memoise it in ``urls``."""
+    url = urls[(public, path)] = (auth.market_url if public else auth.base_url) + path
+    return url
 
 
 # ---------------------------------------------------------------------------
@@ -147,6 +328,21 @@ class GRVTRestClient:
     def __init__(self, auth: GRVTAuth, timeout: float = 10.0) -> None:
         self._auth    = auth
         self._timeout = timeout
+        # Public (market-data) calls reuse one pooled, cookie-less session
+        self._public_session = _pooled_session()
+        # (public, path) -> absolute URL; paths are a small fixed set
+        self._urls: dict[tuple[bool, str], str] = {}
+
+    def __enter__(self) -> "GRVTRestClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections (public and authenticated)."""
+        self._public_session.close()
+        self._auth.close()
 
     # ------------------------------------------------------------------
     # Internal request helper
@@ -159,45 +355,48 @@ class GRVTRestClient:
         *,
         json: Optional[dict[str, Any]] = None,
         public: bool = False,
+        raw: bool = False,
     ) -> Any:
         """
         Send a request with automatic retry on retryable status codes.
 
         Parameters
         ----------
-        method  : HTTP method ("GET", "POST", etc.)
+        method  : HTTP method, uppercase ("GET", "POST", etc.)
         path    : Path relative to the base URL
         json    : Request body (for POST/PUT)
         public  : If True, use the market-data base URL without auth cookie
+        raw     : If True, return the undecoded response body (bytes)
         """
-        if public:
-            base    = self._auth.market_url
-            session = requests.Session()
-        else:
-            base    = self._auth.base_url
-            session = self._auth.get_session()
-
-        url     = base + path
-        backoff = _RETRY_BASE_S
+        session = self._public_session if public else self._auth.get_session()
+        url     = self._urls.get((public, path)) or _cache_url(self._urls, self._auth, public, path)
+        # Encoded once with the shared codec (orjson with the "fast" extra)
+        body    = _json.dumps(json) if json is not None else None
+        debug   = logger.isEnabledFor(logging.DEBUG)
 
         for attempt in range(_MAX_RETRIES + 1):
-            logger.debug("%s %s  body=%s  attempt=%d", method.upper(), url, json, attempt)
-            resp = session.request(method, url, json=json, timeout=self._timeout)
+            if debug:
+                logger.debug("%s %s  body=%s  attempt=%d", method, url, json, attempt)
+            resp = session.request(
+                method, url, data=body, headers=_JSON_HEADERS, timeout=self._timeout,
+            )
 
-            if resp.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+            if not (attempt < _MAX_RETRIES and resp.status_code in _RETRY_STATUSES):
                 break
 
+            delay = _retry_delay(attempt, resp.headers.get("Retry-After"))
             logger.warning(
                 "Retryable response %d from %s %s – retrying in %.1f s",
-                resp.status_code, method.upper(), path, backoff,
+                resp.status_code, method, path, delay,
             )
-            time.sleep(backoff)
-            backoff *= _RETRY_EXP
+            time.sleep(delay)
 
         if resp.status_code >= 400:
             raise GRVTAPIError(resp.status_code, resp.text, method=method, path=path)
 
-        return resp.json()
+        if raw:
+            return resp.content
+        return _json.loads(resp.content)
 
     # ------------------------------------------------------------------
     # Order management (private endpoints)
@@ -208,13 +407,8 @@ class GRVTRestClient:
         if not order.signature:
             raise ValueError("order.signature must be set before submitting")
 
-        raw    = self._request("POST", "/full/v1/order", json=_order_to_dict(order))
-        result = raw.get("result", raw)
-        return CreateOrderResponse(
-            order_id=result["order_id"],
-            status=OrderStatus(int(result.get("status", 2))),
-            reason=result.get("reason"),
-        )
+        raw = self._request("POST", "/full/v1/order", json=_order_to_dict(order))
+        return _parse_create_response(raw)
 
     def cancel_order(self, sub_account_id: int, order_id: str) -> CancelOrderResponse:
         """Cancel an open order by ID."""
@@ -234,13 +428,7 @@ class GRVTRestClient:
         quote: Optional[str]      = None,
     ) -> CancelAllOrdersResponse:
         """Cancel all open orders for a sub-account (optionally filtered)."""
-        body: dict[str, Any] = {"sub_account_id": str(sub_account_id)}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
+        body = _with_filters({"sub_account_id": str(sub_account_id)}, kind, base, quote)
 
         raw    = self._request("POST", "/full/v1/cancel_all_orders", json=body)
         result = raw.get("result", raw)
@@ -254,26 +442,59 @@ class GRVTRestClient:
         quote: Optional[str]      = None,
     ) -> list[Order]:
         """Return all open orders for a sub-account."""
-        body: dict[str, Any] = {"sub_account_id": str(sub_account_id)}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
-
-        raw        = self._request("POST", "/full/v1/open_orders", json=body)
-        orders_raw = raw.get("result", {}).get("open_orders", [])
-        return [_parse_order(o) for o in orders_raw]
+        body = _with_filters({"sub_account_id": str(sub_account_id)}, kind, base, quote)
+
+        content = self._request("POST", "/full/v1/open_orders", json=body, raw=True)
+        return _parse_orders_json(content).open_orders
 
     def get_order(self, sub_account_id: int, order_id: str) -> Order:
         """Fetch a single order by ID."""
-        body       = {"sub_account_id": str(sub_account_id), "order_id": order_id}
-        raw        = self._request("POST", "/full/v1/order_history", json=body)
-        orders_raw = raw.get("result", {}).get("orders", [])
-        if not orders_raw:
+        body    = {"sub_account_id": str(sub_account_id), "order_id": order_id}
+        content = self._request("POST", "/full/v1/order_history", json=body, raw=True)
+        orders  = _parse_orders_json(content).orders
+        if not orders:
             raise GRVTAPIError(404, f"Order {order_id!r} not found", method="POST", path="/full/v1/order_history")
-        return _parse_order(orders_raw[0])
+        return orders[0]
+
+    def create_orders(
+        self,
+        orders: Iterable[Order],
+        *,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> list[CreateOrderResponse]:
+        """
+        Submit signed orders concurrently on worker threads.
+
+        Responses are in input order.  Orders are submitted one at a time as
+        slots free up, so at most ``max_inflight`` requests are ever queued
+        or running, each on its own pooled keep-alive connection.  After the
+        first failure no further orders are submitted: requests already in
+        flight are awaited and the first exception is raised.
+        """
+        if max_inflight < 1:
+            raise ValueError(f"max_inflight must be >= 1, got {max_inflight}")
+        orders = list(orders)
+        if not orders:
+            return []
+        # Log in once up front rather than racing logins from the workers
+        self._auth.get_session()
+        results: list[Optional[CreateOrderResponse]] = [None] * len(orders)
+        pending: dict[Future[CreateOrderResponse], int] = {}
+        pool = ThreadPoolExecutor(max_workers=min(max_inflight, len(orders)))
+        try:
+            for i, order in enumerate(orders):
+                if len(pending) >= max_inflight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        results[pending.pop(fut)] = fut.result()
+                pending[pool.submit(self.create_order, order)] = i
+            for fut, i in pending.items():
+                results[i] = fut.result()
+        finally:
+            # On failure drop anything not yet started; in-flight requests
+            # cannot be interrupted, so wait for them before returning.
+            pool.shutdown(wait=True, cancel_futures=True)
+        return cast(list[CreateOrderResponse], results)
 
     # ------------------------------------------------------------------
     # Account / position endpoints (private)
@@ -297,19 +518,9 @@ class GRVTRestClient:
 
     def get_recent_trades(self, instrument: str, limit: int = 100) -> list[Trade]:
         """Fetch the most recent public trades for an instrument."""
-        raw        = self._request("POST", "/full/v1/trades", json={"instrument": instrument, "limit": limit}, public=True)
-        trades_raw = raw.get("result", {}).get("trades", [])
-        return [
-            Trade(
-                trade_id=t["trade_id"],
-                instrument=instrument,
-                price=t["price"],
-                size=t["size"],
-                side=Side(int(t["is_taker_buyer"])),
-                timestamp=int(t["created_time"]),
-            )
-            for t in trades_raw
-        ]
+        body    = {"instrument": instrument, "limit": limit}
+        content = self._request("POST", "/full/v1/trades", json=body, public=True, raw=True)
+        return _parse_trades_json(instrument, content)
 
     def get_instruments(
         self,
@@ -318,41 +529,84 @@ class GRVTRestClient:
         quote: Optional[str]      = None,
     ) -> list[Instrument]:
         """List available instruments (public endpoint)."""
-        body: dict[str, Any] = {"is_active": [True]}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
+        body = _with_filters({"is_active": [True]}, kind, base, quote)
 
-        raw: dict[str, Any] = self._request("POST", "/full/v1/instruments", json=body, public=True)
-        result: dict[str, Any] = raw.get("result", {})
-        return [Instrument.model_validate(i) for i in result.get("instruments", [])]
+        content = self._request("POST", "/full/v1/instruments", json=body, public=True, raw=True)
+        return _parse_instruments_json(content)
 
 
 # ---------------------------------------------------------------------------
 # Async client
 # ---------------------------------------------------------------------------
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+async def _gather_bounded(
+    fn: Callable[[_T], Awaitable[_R]],
+    items: Iterable[_T],
+    max_inflight: int,
+) -> list[_R]:
+    """
+    Run ``fn`` over ``items`` concurrently, at most ``max_inflight`` at a time.
+
+    Results are returned in input order.  After the first failure no
+    further calls are started: items still queued are skipped, calls
+    already in flight are awaited (their results discarded), and then the
+    first exception is raised.
+    """
+    if max_inflight < 1:
+        raise ValueError(f"max_inflight must be >= 1, got {max_inflight}")
+    sem = asyncio.Semaphore(max_inflight)
+    first_error: Optional[Exception] = None
+
+    async def _one(item: _T) -> Optional[_R]:
+        nonlocal first_error
+        async with sem:
+            if first_error is not None:
+                return None             # batch already failed: never sent
+            try:
+                return await fn(item)
+            except Exception as exc:
+                if first_error is None:
+                    first_error = exc
+                raise
+
+    results = await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
+    if first_error is not None:
+        raise first_error
+    return cast(list[_R], results)
+
+
 class AsyncGRVTRestClient:
     """
     Async REST client for GRVT Exchange (aiohttp-based).
 
     Shares the same GRVTAuth instance as the WebSocket client so a single
-    event loop can drive both without thread-bridging.
+    event loop can drive both without thread-bridging.  Runs on any asyncio
+    loop; uvloop (the ``fast`` extra) is the recommended one, started by the
+    application with ``uvloop.run(main())``.
 
     Usage
     -----
         async with AsyncGRVTRestClient(auth=auth) as client:
             book = await client.get_orderbook("BTC_USDT_Perp")
             resp = await client.create_order(order)
+
+            # Batches run concurrently (bounded by max_inflight), results in order
+            resps = await client.create_orders(orders)
     """
 
     def __init__(self, auth: GRVTAuth, timeout: float = 10.0) -> None:
         self._auth    = auth
         self._timeout = timeout
         self._session: Any = None   # aiohttp.ClientSession, created on first use
+        # (public, path) -> absolute URL; paths are a small fixed set
+        self._urls: dict[tuple[bool, str], str] = {}
+        # Private-call headers, rebuilt only when the cookie changes
+        self._cookie:          str = ""
+        self._private_headers: dict[str, str] = _JSON_HEADERS
 
     async def __aenter__(self) -> "AsyncGRVTRestClient":
         return self
@@ -369,6 +623,18 @@ class AsyncGRVTRestClient:
     # Internal async request helper
     # ------------------------------------------------------------------
 
+    def _open_session(self) -> Any:
+        """Create the pooled aiohttp.ClientSession used for every request."""
+        import aiohttp  # lazy import – only needed for async usage
+
+        # The timeout is a session default, so requests don't each build a
+        # ClientTimeout.
+        self._session = aiohttp.ClientSession(
+            connector=_async_connector(),
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+        )
+        return self._session
+
     async def _request(
         self,
         method: str,
@@ -376,44 +642,48 @@ class AsyncGRVTRestClient:
         *,
         json: Optional[dict[str, Any]] = None,
         public: bool = False,
+        raw: bool = False,
     ) -> Any:
-        import aiohttp
-
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        session = self._session
+        if session is None or session.closed:
+            session = self._open_session()
 
         if public:
-            base    = self._auth.market_url
-            headers = {}
+            headers = _JSON_HEADERS
         else:
-            base    = self._auth.base_url
-            cookie  = await self._auth.async_get_cookie()
-            headers = {"Cookie": f"exchange_token={cookie}"}
-
-        url     = base + path
-        backoff = _RETRY_BASE_S
-
+            # Log in over the same pool when the cookie needs refreshing
+            cookie  = await self._auth.async_get_cookie(session=session)
+            if cookie != self._cookie:
+                self._cookie          = cookie
+                self._private_headers = {**_JSON_HEADERS, "Cookie": f"exchange_token={cookie}"}
+            headers = self._private_headers
+
+        url     = self._urls.get((public, path)) or _cache_url(self._urls, self._auth, public, path)
+        body    = _json.dumps(json) if json is not None else None
+        debug   = logger.isEnabledFor(logging.DEBUG)
+
+        # Happy path: one `async with`, returned from inside it.  Only a
+        # retryable status leaves the block, so the back-off and its log line
+        # run after the response has been released.
         for attempt in range(_MAX_RETRIES + 1):
-            logger.debug("%s %s  body=%s  attempt=%d", method.upper(), url, json, attempt)
-            async with self._session.request(
-                method, url,
-                json=json,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self._timeout),
-            ) as resp:
+            if debug:
+                logger.debug("%s %s  body=%s  attempt=%d", method, url, json, attempt)
+            async with session.request(method, url, data=body, headers=headers) as resp:
                 status = resp.status
-                if status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                if not (attempt < _MAX_RETRIES and status in _RETRY_STATUSES):
                     if status >= 400:
-                        body = await resp.text()
-                        raise GRVTAPIError(status, body, method=method, path=path)
-                    return await resp.json()
+                        text = await resp.text()
+                        raise GRVTAPIError(status, text, method=method, path=path)
+                    content = await resp.read()
+                    return content if raw else _json.loads(content)
+                retry_after = resp.headers.get("Retry-After")
 
+            delay = _retry_delay(attempt, retry_after)
             logger.warning(
                 "Retryable response %d from %s %s – retrying in %.1f s",
-                status, method.upper(), path, backoff,
+                status, method, path, delay,
             )
-            await asyncio.sleep(backoff)
-            backoff *= _RETRY_EXP
+            await asyncio.sleep(delay)
 
     # ------------------------------------------------------------------
     # Order management
@@ -422,13 +692,8 @@ class AsyncGRVTRestClient:
     async def create_order(self, order: Order) -> CreateOrderResponse:
         if not order.signature:
             raise ValueError("order.signature must be set before submitting")
-        raw    = await self._request("POST", "/full/v1/order", json=_order_to_dict(order))
-        result = raw.get("result", raw)
-        return CreateOrderResponse(
-            order_id=result["order_id"],
-            status=OrderStatus(int(result.get("status", 2))),
-            reason=result.get("reason"),
-        )
+        raw = await self._request("POST", "/full/v1/order", json=_order_to_dict(order))
+        return _parse_create_response(raw)
 
     async def cancel_order(self, sub_account_id: int, order_id: str) -> CancelOrderResponse:
         body   = {"sub_account_id": str(sub_account_id), "order_id": order_id}
@@ -446,13 +711,7 @@ class AsyncGRVTRestClient:
         base:  Optional[str]      = None,
         quote: Optional[str]      = None,
     ) -> CancelAllOrdersResponse:
-        body: dict[str, Any] = {"sub_account_id": str(sub_account_id)}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
+        body   = _with_filters({"sub_account_id": str(sub_account_id)}, kind, base, quote)
         raw    = await self._request("POST", "/full/v1/cancel_all_orders", json=body)
         result = raw.get("result", raw)
         return CancelAllOrdersResponse(num_cancelled=int(result.get("num_cancelled", 0)))
@@ -464,16 +723,40 @@ class AsyncGRVTRestClient:
         base:  Optional[str]      = None,
         quote: Optional[str]      = None,
     ) -> list[Order]:
-        body: dict[str, Any] = {"sub_account_id": str(sub_account_id)}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
-        raw        = await self._request("POST", "/full/v1/open_orders", json=body)
-        orders_raw = raw.get("result", {}).get("open_orders", [])
-        return [_parse_order(o) for o in orders_raw]
+        body    = _with_filters({"sub_account_id": str(sub_account_id)}, kind, base, quote)
+        content = await self._request("POST", "/full/v1/open_orders", json=body, raw=True)
+        return _parse_orders_json(content).open_orders
+
+    async def get_order(self, sub_account_id: int, order_id: str) -> Order:
+        """Fetch a single order by ID."""
+        body    = {"sub_account_id": str(sub_account_id), "order_id": order_id}
+        content = await self._request("POST", "/full/v1/order_history", json=body, raw=True)
+        orders  = _parse_orders_json(content).orders
+        if not orders:
+            raise GRVTAPIError(404, f"Order {order_id!r} not found", method="POST", path="/full/v1/order_history")
+        return orders[0]
+
+    async def create_orders(
+        self,
+        orders: Iterable[Order],
+        *,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> list[CreateOrderResponse]:
+        """Submit signed orders concurrently; responses are in input order."""
+        return await _gather_bounded(self.create_order, orders, max_inflight)
+
+    async def cancel_orders(
+        self,
+        sub_account_id: int,
+        order_ids: Iterable[str],
+        *,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> list[CancelOrderResponse]:
+        """Cancel orders by ID concurrently; responses are in input order."""
+        async def _cancel(order_id: str) -> CancelOrderResponse:
+            return await self.cancel_order(sub_account_id, order_id)
+
+        return await _gather_bounded(_cancel, order_ids, max_inflight)
 
     async def get_account_summary(self, sub_account_id: int) -> AccountSummary:
         body   = {"sub_account_id": str(sub_account_id)}
@@ -489,20 +772,23 @@ class AsyncGRVTRestClient:
         raw = await self._request("POST", "/full/v1/book", json={"instrument": instrument, "depth": depth}, public=True)
         return _parse_orderbook(instrument, raw.get("result", raw))
 
+    async def get_orderbooks(
+        self,
+        instruments: Iterable[str],
+        depth: int = 10,
+        *,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> list[Orderbook]:
+        """Fetch several order books concurrently; results are in input order."""
+        async def _book(instrument: str) -> Orderbook:
+            return await self.get_orderbook(instrument, depth)
+
+        return await _gather_bounded(_book, instruments, max_inflight)
+
     async def get_recent_trades(self, instrument: str, limit: int = 100) -> list[Trade]:
-        raw        = await self._request("POST", "/full/v1/trades", json={"instrument": instrument, "limit": limit}, public=True)
-        trades_raw = raw.get("result", {}).get("trades", [])
-        return [
-            Trade(
-                trade_id=t["trade_id"],
-                instrument=instrument,
-                price=t["price"],
-                size=t["size"],
-                side=Side(int(t["is_taker_buyer"])),
-                timestamp=int(t["created_time"]),
-            )
-            for t in trades_raw
-        ]
+        body    = {"instrument": instrument, "limit": limit}
+        content = await self._request("POST", "/full/v1/trades", json=body, public=True, raw=True)
+        return _parse_trades_json(instrument, content)
 
     async def get_instruments(
         self,
@@ -511,13 +797,159 @@ class AsyncGRVTRestClient:
         quote: Optional[str]      = None,
     ) -> list[Instrument]:
         """List available instruments (public endpoint)."""
-        body: dict[str, Any] = {"is_active": [True]}
-        if kind is not None:
-            body["kind"] = [int(kind)]
-        if base is not None:
-            body["base"] = [base]
-        if quote is not None:
-            body["quote"] = [quote]
-        raw: dict[str, Any] = await self._request("POST", "/full/v1/instruments", json=body, public=True)
-        result: dict[str, Any] = raw.get("result", {})
-        return [Instrument.model_validate(i) for i in result.get("instruments", [])]
+        body    = _with_filters({"is_active": [True]}, kind, base, quote)
+        content = await self._request("POST", "/full/v1/instruments", json=body, public=True, raw=True)
+        return _parse_instruments_json(content)
+
+
+# ---------------------------------------------------------------------------
+# Cancel coalescing
+# ---------------------------------------------------------------------------
+
+class CancelCoalescer:
+    """
+    Deduplicates bursts of ``cancel_order`` calls and dispatches them bounded.
+
+    This is not request batching: GRVT has no multi-ID cancel endpoint, so
+    each distinct order still costs one request.  Calls made within
+    ``window`` seconds of the first pending one are collected, repeated
+    cancels of the same order share a single request, and the distinct
+    cancels go out over the client's pooled session at most
+    ``max_inflight`` at a time.  If a dispatch is cancelled, every cancel
+    it had not yet answered is cancelled too, so no caller waits forever.
+
+    Usage
+    -----
+        coalescer = CancelCoalescer(client.rest)
+        await asyncio.gather(*(coalescer.cancel_order(sub_id, oid) for oid in ids))
+        await coalescer.aclose()
+    """
+
+    def __init__(
+        self,
+        client: AsyncGRVTRestClient,
+        window: float = 0.001,
+        *,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> None:
+        if max_inflight < 1:
+            raise ValueError(f"max_inflight must be >= 1, got {max_inflight}")
+        self._client       = client
+        self._window       = window
+        self._max_inflight = max_inflight
+        self._pending: dict[tuple[int, str], asyncio.Future[CancelOrderResponse]] = {}
+        self._timer:   Optional[asyncio.TimerHandle] = None
+        self._tasks:   set[asyncio.Task[None]] = set()
+
+    async def cancel_order(self, sub_account_id: int, order_id: str) -> CancelOrderResponse:
+        """Queue a cancel and wait for its response."""
+        key = (sub_account_id, order_id)
+        fut = self._pending.get(key)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut  = self._pending[key] = loop.create_future()
+            if self._timer is None:
+                self._timer = loop.call_later(self._window, self._flush)
+        # Shielded: one waiter giving up must not cancel a shared request
+        return await asyncio.shield(fut)
+
+    async def aclose(self) -> None:
+        """Dispatch anything still queued and wait for in-flight cancels."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._timer = None
+        task = asyncio.ensure_future(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self, pending: dict[tuple[int, str], asyncio.Future[CancelOrderResponse]],
+    ) -> None:
+        async def _cancel(key: tuple[int, str]) -> None:
+            fut = pending[key]
+            try:
+                resp = await self._client.cancel_order(*key)
+            except Exception as exc:  # noqa: BLE001 – re-raised in the waiting caller
+                if not fut.done():
+                    fut.set_exception(exc)
+            else:
+                if not fut.done():
+                    fut.set_result(resp)
+
+        try:
+            await _gather_bounded(_cancel, pending, self._max_inflight)
+        finally:
+            for fut in pending.values():
+                if not fut.done():
+                    fut.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Client pool
+# ---------------------------------------------------------------------------
+
+def _transport_errors() -> tuple[type[BaseException], ...]:
+    """Exceptions after which a client's sockets may be broken."""
+    try:
+        import aiohttp  # lazy import – only needed for async usage
+    except ImportError:
+        return (OSError, asyncio.TimeoutError)
+    return (aiohttp.ClientError, OSError, asyncio.TimeoutError)
+
+
+class AsyncClientPool:
+    """
+    LIFO pool of AsyncGRVTRestClient instances sharing one GRVTAuth.
+
+    Each client owns its own connection pool, so concurrent workers (e.g.
+    one per sub-account) do not queue on a single connector.  ``acquire()``
+    hands out the most recently returned client first, whose keep-alive
+    connections are the most likely to still be open.  A client whose
+    request fails with a transport error (aiohttp.ClientError, OSError or a
+    timeout) has its session closed on release and reconnects on next use;
+    any other error, including GRVTAPIError, leaves it intact.
+
+    Usage
+    -----
+        async with AsyncClientPool(auth, size=4) as pool:
+            async with pool.acquire() as rest:
+                await rest.cancel_order(sub_account_id, order_id)
+    """
+
+    def __init__(self, auth: GRVTAuth, size: int = 4, timeout: float = 10.0) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self._clients = [AsyncGRVTRestClient(auth, timeout=timeout) for _ in range(size)]
+        self._idle    = list(self._clients)
+        self._free    = asyncio.Semaphore(size)
+        self._transport_errors = _transport_errors()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every client's pooled session."""
+        for client in self._clients:
+            await client.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncGRVTRestClient]:
+        """Borrow a client, waiting while all of them are in use."""
+        async with self._free:
+            client = self._idle.pop()   # LIFO: warmest connections first
+            try:
+                yield client
+            except self._transport_errors:
+                await client.close()    # drop possibly broken sockets
+                raise
+            finally:
+                self._idle.append(client)
@@ -18,16 +18,18 @@ NonceProvider
 A nonce must be unique per signing key per session.  The default provider
 uses a millisecond timestamp truncated to uint32, which is fine for low
 frequency usage.  For market makers submitting many orders per second,
-plug in a sequence-based provider::
+plug in the sequence-based provider::
 
-    class SeqNonce:
-        def __init__(self):
-            self._n = 0
-        def __call__(self) -> int:
-            self._n += 1
-            return self._n & 0xFFFF_FFFF
+    sign_order(order, pk, chain_id, contract, nonce_provider=SequenceNonce())
 
-    sign_order(order, pk, chain_id, contract, nonce_provider=SeqNonce())
+OrderSigner
+-----------
+sign_order() parses the private key on every call; nothing derived from
+it is kept at module level.  Repeated signing should bind the key once and
+reuse the signer instead::
+
+    signer = make_signer(pk, chain_id, contract, nonce_provider=SequenceNonce())
+    signer.sign(order)          # same signature sign_order() would produce
 
 References
 ----------
@@ -37,12 +39,19 @@ References
 
 from __future__ import annotations
 
+import itertools
 import time
 from decimal import Decimal
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
 
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage
+from eth_account.signers.local import LocalAccount
+
+# eth_hash.auto resolves to this same backend (pycryptodome is a declared
+# dependency) but routes each call through Keccak256's argument checks.
+from eth_hash.backends.pycryptodome import keccak256 as keccak
 
 from .types import Order, OrderLeg
 
@@ -83,17 +92,51 @@ _EIP712_TYPES: dict[str, Any] = {
     ],
 }
 
+# EIP-712 type strings (encodeType) for the structs above, and their hashes.
+# They never change, so they are hashed once here instead of being re-derived
+# from _EIP712_TYPES on every signature.
+_DOMAIN_TYPE = (
+    "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+_LEG_TYPE   = "OrderLeg(uint256 instrumentID,uint64 size,uint64 limitPrice,bool isBuyingAsset)"
+_ORDER_TYPE = (
+    "Order(uint64 subAccountID,uint8 timeInForce,bool postOnly,bool reduceOnly,"
+    "OrderLeg[] legs,uint32 nonce,int64 expiration)" + _LEG_TYPE
+)
+_DOMAIN_TYPEHASH: bytes = keccak(_DOMAIN_TYPE.encode())
+_LEG_TYPEHASH:   bytes = keccak(_LEG_TYPE.encode())
+_ORDER_TYPEHASH: bytes = keccak(_ORDER_TYPE.encode())
+
+_TRUE_WORD  = (1).to_bytes(32, "big")
+_FALSE_WORD = bytes(32)
+
 # GRVT uses fixed-point integers for on-chain encoding.
-# Prices and sizes are multiplied by these factors before being stored
+# Prices and sizes are both multiplied by this factor before being stored
 # as uint64. We use Decimal to avoid float precision bugs
 # (e.g. int(float("1.013") * 1e9) == 1012999999, not 1013000000).
-_PRICE_SCALE: int = 10 ** 9
-_SIZE_SCALE:  int = 10 ** 9
+_SCALE: int = 10 ** 9
 
 
 def _default_nonce() -> int:
     """Default nonce: current Unix timestamp in ms, truncated to uint32."""
-    return int(time.time() * 1000) & 0xFFFF_FFFF
+    return (time.time_ns() // 1_000_000) & 0xFFFF_FFFF
+
+
+class SequenceNonce:
+    """
+    NonceProvider returning consecutive uint32 nonces.
+
+    Seeded from the same millisecond clock as the default nonce unless
+    ``start`` is given, then incremented on every call, so a burst of
+    orders never repeats a nonce.  Safe to share between threads:
+    itertools.count() advances atomically.
+    """
+
+    def __init__(self, start: Optional[int] = None) -> None:
+        self._counter = itertools.count(_default_nonce() + 1 if start is None else start)
+
+    def __call__(self) -> int:
+        return next(self._counter) & 0xFFFF_FFFF
 
 
 # ---------------------------------------------------------------------------
@@ -128,10 +171,120 @@ def build_eip712_domain(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=16)
+def _domain_hash(chain_id: int, verifying_contract: str) -> bytes:
+    """
+    EIP-712 domain separator hash for GRVT's default domain.
+
+    Fixed for a given chain / contract, so it is hashed once per pair
+    rather than on every signature.  Encoded by hand from _DOMAIN_TYPE,
+    like the Order struct, so no private eth_account helper is needed.
+    Returns immutable bytes, so cached values are safe to share.
+    """
+    domain  = build_eip712_domain(chain_id, verifying_contract)
+    address = bytes.fromhex(verifying_contract.removeprefix("0x").removeprefix("0X"))
+    if len(address) != 20:
+        raise ValueError(f"verifying_contract {verifying_contract!r} is not a 20-byte address")
+    return keccak(b"".join((
+        _DOMAIN_TYPEHASH,
+        keccak(domain["name"].encode()),
+        keccak(domain["version"].encode()),
+        _uint_word(chain_id, 256, "chainId"),
+        address.rjust(32, b"\0"),
+    )))
+
+
+def _signable(domain_hash: bytes, order: Order, nonce: int) -> SignableMessage:
+    """
+    Build the EIP-712 message to sign; equivalent to encode_typed_data().
+
+    Takes the already-hashed domain separator (see _domain_hash), so every
+    signing path – sign_order, recover_signer, OrderSigner – only hashes
+    the Order struct per call.
+    """
+    return SignableMessage(b"\x01", domain_hash, _hash_order(order, nonce))
+
+
+def _uint_word(value: int, bits: int, name: str) -> bytes:
+    """ABI-encode an unsigned integer field as one 32-byte word."""
+    if not 0 <= value < 1 << bits:
+        raise ValueError(f"{name}={value} does not fit in uint{bits}")
+    return value.to_bytes(32, "big")
+
+
+def _int_word(value: int, bits: int, name: str) -> bytes:
+    """ABI-encode a signed integer field as one 32-byte two's-complement word."""
+    bound = 1 << (bits - 1)
+    if not -bound <= value < bound:
+        raise ValueError(f"{name}={value} does not fit in int{bits}")
+    return value.to_bytes(32, "big", signed=True)
+
+
+def _scale9(value: str) -> int:
+    """
+    Fixed-point integer for a decimal price / size string: nine decimals,
+    with anything finer truncated toward zero (never rounded).
+    """
+    return int(Decimal(value) * _SCALE)
+
+
+@lru_cache(maxsize=1024)
+def _instrument_word(instrument_hash: str) -> bytes:
+    """
+    The instrumentID field's 32-byte word for a hex instrument hash.
+
+    A market maker re-signs the same few instruments continuously, so the
+    hex parse and packing are done once per instrument.
+    """
+    return _uint_word(int(instrument_hash, 16), 256, "instrumentID")
+
+
+@lru_cache(maxsize=1024)
+def _leg_hash(instrument_hash: str, size: str, limit_price: str, is_buying_asset: bool) -> bytes:
+    """
+    EIP-712 hashStruct of one OrderLeg, keyed by its field values.
+
+    Re-quotes and retries sign the same legs again with a new nonce; a hit
+    skips both Decimal parses and the keccak call.
+    """
+    return keccak(
+        _LEG_TYPEHASH
+        + _instrument_word(instrument_hash)
+        + _uint_word(_scale9(size),        64, "size")
+        + _uint_word(_scale9(limit_price), 64, "limitPrice")
+        + (_TRUE_WORD if is_buying_asset else _FALSE_WORD)
+    )
+
+
+def _hash_order(order: Order, nonce: int) -> bytes:
+    """
+    EIP-712 hashStruct of the Order message, encoded directly.
+
+    Equivalent to eth_account's hash_eip712_message(types, message) for
+    _EIP712_TYPES, but with the type hashes precomputed and each field
+    packed straight into its 32-byte word – no per-call walk of the type
+    definitions.
+    """
+    leg_hashes = b"".join(
+        _leg_hash(leg.instrument_hash, leg.size, leg.limit_price, leg.is_buying_asset)
+        for leg in order.legs
+    )
+    return keccak(
+        _ORDER_TYPEHASH
+        + _uint_word(order.sub_account_id,     64, "subAccountID")
+        + _uint_word(int(order.time_in_force), 8,  "timeInForce")
+        + (_TRUE_WORD if order.post_only else _FALSE_WORD)
+        + (_TRUE_WORD if order.reduce_only else _FALSE_WORD)
+        + keccak(leg_hashes)
+        + _uint_word(nonce,                    32, "nonce")
+        + _int_word(order.expiration,          64, "expiration")
+    )
+
+
 def _encode_leg(leg: OrderLeg) -> dict[str, Any]:
     """Convert an OrderLeg into the dict expected by EIP-712 encoding."""
-    size_int  = int(Decimal(leg.size)        * _SIZE_SCALE)
-    price_int = int(Decimal(leg.limit_price) * _PRICE_SCALE)
+    size_int  = _scale9(leg.size)
+    price_int = _scale9(leg.limit_price)
     instrument_id = int(leg.instrument_hash, 16)
     return {
         "instrumentID":  instrument_id,
@@ -145,8 +298,9 @@ def _build_order_message(order: Order, nonce: int) -> dict[str, Any]:
     """
     Build the EIP-712 message dict from an Order.
 
-    Shared by sign_order() and recover_signer() to guarantee they
-    always produce identical encodings and never drift.
+    The generic form of what _hash_order() packs by hand; kept as the
+    reference encoding (eth_account's encode_typed_data takes it as-is)
+    that tests check _hash_order() against.  No signing path calls it.
 
     post_only and reduce_only are read directly from the Order dataclass.
     """
@@ -202,26 +356,51 @@ def sign_order(
     -----
     - Never reuse a nonce on retry – pass a new nonce each attempt.
     - post_only and reduce_only are taken from order.post_only / order.reduce_only.
+    - The key is parsed on every call; for repeated signing bind it once
+      with make_signer() and call signer.sign().
     """
     if nonce is None:
         nonce = nonce_provider() if nonce_provider is not None else _default_nonce()
 
-    domain  = build_eip712_domain(chain_id, verifying_contract)
-    message = _build_order_message(order, nonce)
-
-    signable = encode_typed_data(
-        domain_data=domain,
-        message_types={k: v for k, v in _EIP712_TYPES.items() if k != "EIP712Domain"},
-        message_data=message,
-    )
-
-    signed  = Account.sign_message(signable, private_key=private_key)
+    signable = _signable(_domain_hash(chain_id, verifying_contract), order, nonce)
+    signed   = Account.from_key(private_key).sign_message(signable)
     sig_hex: str = signed.signature.hex()
 
     order.signature = sig_hex
     return sig_hex
 
 
+def sign_orders(
+    orders: Iterable[Order],
+    private_key: str,
+    chain_id: int,
+    verifying_contract: str,
+    nonce_provider: Optional[NonceProvider] = None,
+) -> list[str]:
+    """
+    EIP-712 sign a batch of Orders; returns the signatures in input order.
+
+    The key and domain separator are resolved once for the whole batch and
+    each order's ``signature`` is set as with ``sign_order``.  Signatures
+    are identical to calling ``sign_order`` per order with the same nonces.
+
+    ``nonce_provider`` is called once per order.  By default a fresh
+    SequenceNonce is used, so every order in the batch gets a distinct
+    nonce even when several are signed within one millisecond.
+    """
+    account     = Account.from_key(private_key)
+    domain_hash = _domain_hash(chain_id, verifying_contract)
+    next_nonce  = nonce_provider or SequenceNonce()
+
+    signatures: list[str] = []
+    for order in orders:
+        signed  = account.sign_message(_signable(domain_hash, order, next_nonce()))
+        sig_hex: str = signed.signature.hex()
+        order.signature = sig_hex
+        signatures.append(sig_hex)
+    return signatures
+
+
 def recover_signer(
     order: Order,
     chain_id: int,
@@ -247,17 +426,80 @@ def recover_signer(
     if order.signature is None:
         raise ValueError("order.signature is not set")
 
-    domain   = build_eip712_domain(chain_id, verifying_contract)
-    message  = _build_order_message(order, nonce)
-
-    signable = encode_typed_data(
-        domain_data=domain,
-        message_types={k: v for k, v in _EIP712_TYPES.items() if k != "EIP712Domain"},
-        message_data=message,
-    )
+    signable = _signable(_domain_hash(chain_id, verifying_contract), order, nonce)
 
     address: str = Account.recover_message(
         signable,
         signature=bytes.fromhex(order.signature.removeprefix("0x")),
     )
     return address
+
+
+# ---------------------------------------------------------------------------
+# Reusable signer
+# ---------------------------------------------------------------------------
+
+class OrderSigner:
+    """
+    EIP-712 order signer bound to one key, chain ID and verifying contract.
+
+    The private key is parsed and the domain separator hashed once, in
+    ``__init__``; ``sign()`` then only hashes the Order struct.  Signatures
+    are identical to those produced by ``sign_order`` with the same
+    arguments, so ``recover_signer`` verifies them unchanged.
+
+    Parameters
+    ----------
+    private_key         : Hex private key of the signing wallet (with or
+                          without leading ``0x``)
+    chain_id            : EVM chain ID for the domain separator
+    verifying_contract  : GRVT verifying contract address
+    nonce_provider      : Optional Callable[[], int] used when ``sign()`` is
+                          called without an explicit nonce.  Defaults to the
+                          millisecond-timestamp nonce used by ``sign_order``.
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        chain_id: int,
+        verifying_contract: str,
+        nonce_provider: Optional[NonceProvider] = None,
+    ) -> None:
+        self._account:        LocalAccount  = Account.from_key(private_key)
+        self._domain_hash:    bytes         = _domain_hash(chain_id, verifying_contract)
+        self._nonce_provider: NonceProvider = nonce_provider or _default_nonce
+
+    @property
+    def address(self) -> str:
+        """Checksummed address of the signing wallet."""
+        address: str = self._account.address
+        return address
+
+    def sign(self, order: Order, nonce: Optional[int] = None) -> str:
+        """
+        EIP-712 sign an Order and return the hex-encoded signature.
+
+        As with ``sign_order``, the signature is also stored in
+        ``order.signature``.  ``nonce`` overrides the signer's nonce provider
+        for this call.
+        """
+        if nonce is None:
+            nonce = self._nonce_provider()
+
+        signed  = self._account.sign_message(_signable(self._domain_hash, order, nonce))
+        sig_hex: str = signed.signature.hex()
+
+        order.signature = sig_hex
+        return sig_hex
+
+
+def make_signer(
+    private_key: str,
+    chain_id: int,
+    verifying_contract: str,
+    *,
+    nonce_provider: Optional[NonceProvider] = None,
+) -> OrderSigner:
+    """Factory function to create an OrderSigner."""
+    return OrderSigner(private_key, chain_id, verifying_contract, nonce_provider=nonce_provider)
@@ -26,9 +26,16 @@ from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
 from enum import IntEnum, unique
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    GetPydanticSchema,
+    field_validator,
+)
+from pydantic_core import core_schema
 
 
 # ---------------------------------------------------------------------------
@@ -48,7 +55,11 @@ class GRVTEnv(IntEnum):
 
     @property
     def label(self) -> str:
-        return self.name.lower()
+        return _ENV_LABELS[self]
+
+
+# Lowercase labels ("testnet", ...), built once instead of per .label access
+_ENV_LABELS: dict[GRVTEnv, str] = {env: env.name.lower() for env in GRVTEnv}
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +112,34 @@ def _validate_decimal_string(v: str, field: str = "value") -> str:
     return v
 
 
+# Plain decimal literals ("50000.5", "-0.01", "1e-9"): every string this
+# matches is also accepted by Decimal().
+_DECIMAL_PATTERN = r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$"
+
+# Decimal string field for the response / stream models.  pydantic-core
+# accepts the common case with its compiled regex, with no Python call per
+# value; anything else falls through to _validate_decimal_string, so the
+# accepted set is the same as validating with Decimal() directly.  The
+# union reports one "decimal_string" error at the field's own loc rather
+# than one error per branch.
+_DecimalStr = Annotated[
+    str,
+    GetPydanticSchema(
+        lambda _tp, _handler: core_schema.union_schema(
+            [
+                core_schema.str_schema(pattern=_DECIMAL_PATTERN),
+                core_schema.no_info_after_validator_function(
+                    _validate_decimal_string, core_schema.str_schema(),
+                ),
+            ],
+            mode="left_to_right",
+            custom_error_type="decimal_string",
+            custom_error_message="Input should be a non-empty, valid decimal string",
+        )
+    ),
+]
+
+
 def _validate_hex_hash(v: str, field: str = "hash") -> str:
     """Reject strings that are not valid 0x-prefixed hex."""
     stripped = v.removeprefix("0x").removeprefix("0X")
@@ -126,8 +165,8 @@ class Instrument(BaseModel):
     kind:            KindEnum = KindEnum.PERPETUAL
     base_decimals:   int      = 8
     quote_decimals:  int      = 6
-    tick_size:       str      = "0.1"
-    min_size:        str      = "0.0001"
+    tick_size:       _DecimalStr      = "0.1"
+    min_size:        _DecimalStr      = "0.0001"
     expiry:          Optional[int] = None
 
     @field_validator("instrument_hash")
@@ -135,11 +174,6 @@ class Instrument(BaseModel):
     def validate_hash(cls, v: str) -> str:
         return _validate_hex_hash(v, "instrument_hash")
 
-    @field_validator("tick_size", "min_size")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
-
     @field_validator("base_decimals", "quote_decimals")
     @classmethod
     def validate_decimals_positive(cls, v: int) -> int:
@@ -156,11 +190,16 @@ class OrderLeg(BaseModel):
     there is exactly one leg.
 
     instrument_hash : keccak256 of the instrument canonical name
+                      (the API's "instrument" key; accepted on input,
+                      emitted by model_dump(by_alias=True))
     size            : quantity as decimal string (e.g. "0.01")
     limit_price     : worst acceptable execution price as decimal string
     is_buying_asset : True → buy base; False → sell base
     """
-    instrument_hash: str
+    instrument_hash: str = Field(
+        validation_alias=AliasChoices("instrument_hash", "instrument"),
+        serialization_alias="instrument",   # model_dump(by_alias=True) → API leg shape
+    )
     size:            str
     limit_price:     str
     is_buying_asset: bool
@@ -186,6 +225,8 @@ class OrderLeg(BaseModel):
             raise ValueError(f"limit_price must be positive, got '{v}'")
         return v
 
+    model_config = {"validate_assignment": True}
+
 
 class OrderMetadata(BaseModel):
     """
@@ -212,6 +253,8 @@ class OrderMetadata(BaseModel):
             raise ValueError("create_time must be a non-negative Unix nanosecond timestamp")
         return v
 
+    model_config = {"validate_assignment": True}
+
 
 class Order(BaseModel):
     """
@@ -307,15 +350,10 @@ class OpenOrdersResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 class OrderbookLevel(BaseModel):
-    price:      str
-    size:       str
+    price:      _DecimalStr
+    size:       _DecimalStr
     num_orders: int = 0
 
-    @field_validator("price", "size")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
-
 
 class Orderbook(BaseModel):
     """L2 snapshot for a single instrument."""
@@ -329,16 +367,11 @@ class Trade(BaseModel):
     """A single public trade event from the trades stream."""
     trade_id:   str
     instrument: str
-    price:      str
-    size:       str
+    price:      _DecimalStr
+    size:       _DecimalStr
     side:       Side
     timestamp:  int
 
-    @field_validator("price", "size")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
-
 
 # ---------------------------------------------------------------------------
 # Private WebSocket push events
@@ -363,18 +396,13 @@ class Fill(BaseModel):
     order_id:        str
     client_order_id: int
     instrument:      str
-    price:           str
-    size:            str
+    price:           _DecimalStr
+    size:            _DecimalStr
     side:            Side
-    fee:             str
+    fee:             _DecimalStr
     timestamp:       int
     is_maker:        bool = False
 
-    @field_validator("price", "size", "fee")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
-
 
 class OrderUpdate(BaseModel):
     """
@@ -386,17 +414,12 @@ class OrderUpdate(BaseModel):
     client_order_id: int
     instrument:      str
     status:          OrderStatus
-    filled_size:     str
-    remaining_size:  str
-    avg_fill_price:  str
+    filled_size:     _DecimalStr
+    remaining_size:  _DecimalStr
+    avg_fill_price:  _DecimalStr
     reason:          Optional[str] = None
     timestamp:       int = 0
 
-    @field_validator("filled_size", "remaining_size", "avg_fill_price")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
-
 
 # ---------------------------------------------------------------------------
 # Position & account
@@ -405,28 +428,18 @@ class OrderUpdate(BaseModel):
 class Position(BaseModel):
     """Current position for a sub-account on an instrument."""
     instrument:      str
-    size:            str
-    avg_entry_price: str
-    unrealised_pnl:  str
-    realised_pnl:    str
-    margin:          str
-
-    @field_validator("size", "avg_entry_price", "unrealised_pnl", "realised_pnl", "margin")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
+    size:            _DecimalStr
+    avg_entry_price: _DecimalStr
+    unrealised_pnl:  _DecimalStr
+    realised_pnl:    _DecimalStr
+    margin:          _DecimalStr
 
 
 class AccountSummary(BaseModel):
     """High-level account summary for a sub-account."""
     sub_account_id:     int
-    total_equity:       str
-    available_margin:   str
-    initial_margin:     str
-    maintenance_margin: str
+    total_equity:       _DecimalStr
+    available_margin:   _DecimalStr
+    initial_margin:     _DecimalStr
+    maintenance_margin: _DecimalStr
     positions:          list[Position] = []
-
-    @field_validator("total_equity", "available_margin", "initial_margin", "maintenance_margin")
-    @classmethod
-    def validate_decimal(cls, v: str) -> str:
-        return _validate_decimal_string(v)
@@ -17,6 +17,8 @@ This client:
 5. Detects sequence number gaps per channel and calls an optional
    on_gap callback so the consumer can re-sync state.
 6. Supports optional per-channel typed deserialization.
+7. Optionally batches messages per subscription, so a busy channel's
+   handler is awaited once per list of messages instead of per message.
 
 Usage
 -----
@@ -29,6 +31,15 @@ Usage
     async with GRVTWebSocketClient(auth, market_data=True) as ws:
         await ws.subscribe("orderbook.BTC_USDT_Perp", on_book, msg_type=Orderbook)
         await ws.run_forever()
+
+Batched delivery (opt-in)
+-------------------------
+    async def on_books(batch: list[Orderbook]) -> None:
+        latest = batch[-1]
+
+    # Up to 8 messages per call; waits at most 5 ms to fill a batch
+    await ws.subscribe("orderbook.BTC_USDT_Perp", on_books, msg_type=Orderbook,
+                       batch_size=8, batch_timeout=0.005)
 """
 
 from __future__ import annotations
@@ -36,13 +47,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import ssl
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional, Union
 
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from . import _json
 from .auth import GRVTAuth
 
 logger = logging.getLogger(__name__)
@@ -57,10 +71,16 @@ RawHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 # Typed handler: receives a deserialized dataclass instance
 TypedHandler = Callable[[Any], Coroutine[Any, Any, None]]
 
+# Batch handler: receives a list of raw or typed values (batch_size > 1)
+BatchHandler = Callable[[list[Any]], Coroutine[Any, Any, None]]
+
 # Gap callback: called when a sequence number gap is detected
 #   args: channel name, expected sequence, received sequence
 GapCallback = Callable[[str, int, int], Coroutine[Any, Any, None]]
 
+# Decoder: builds a msg_type instance from msg["data"]
+Decoder = Callable[[Any], Any]
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -73,42 +93,85 @@ _RECONNECT_MAX   = 60.0
 _RECONNECT_EXP   = 2.0
 
 
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Default TLS context shared by every WebSocket connection.
+
+    Without it each connect (and every reconnect) builds a fresh context
+    and reloads the system CA store.
+    """
+    return ssl.create_default_context()
+
+
 # ---------------------------------------------------------------------------
 # Subscription registry
 # ---------------------------------------------------------------------------
 
+def _resolve_decoder(msg_type: type[Any]) -> Decoder:
+    """
+    Pick how to build msg_type from a message's data dict.
+
+    Called once per subscription, so the per-message path is a single call
+    instead of re-probing msg_type with hasattr() on every frame.
+    """
+    validate = getattr(msg_type, "model_validate", None)
+    if validate is not None:
+        # Pydantic v2 BaseModel
+        return validate  # type: ignore[no-any-return]
+
+    fields = getattr(msg_type, "__dataclass_fields__", None)
+    if fields is not None:
+        # Dataclass: pass matching kwargs
+        def _from_dict(data: Any) -> Any:
+            return msg_type(**{k: v for k, v in data.items() if k in fields})
+        return _from_dict
+
+    # Fallback: try calling the type directly
+    return msg_type
+
+
 @dataclass
 class _Subscription:
     channel:    str
     params:     dict[str, Any]
-    handler:    TypedHandler                    # always receives a typed or raw value
+    handler:    Union[TypedHandler, BatchHandler]   # a typed or raw value, or a list of them
     msg_type:   Optional[type[Any]]             # if set, data["data"] is deserialized to this type
     raw:        bool = False                    # if True, handler receives the full raw dict
-
-
-def _deserialize(msg: dict[str, Any], msg_type: Optional[type[Any]]) -> Any:
+    batch_size:    int   = 1                    # > 1: handler receives lists of up to this many values
+    batch_timeout: float = 0.0                  # max seconds to wait for a batch to fill
+    decoder:    Optional[Decoder] = field(default=None, init=False, repr=False)
+    queue:      Optional[asyncio.Queue[Any]]  = field(default=None, init=False, repr=False)
+    task:       Optional[asyncio.Task[None]]  = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.msg_type is not None:
+            self.decoder = _resolve_decoder(self.msg_type)
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+
+
+def _deserialize(
+    msg:      dict[str, Any],
+    msg_type: Optional[type[Any]],
+    decoder:  Optional[Decoder] = None,
+) -> Any:
     """
     Attempt to deserialize msg["data"] into msg_type.
 
-    Falls back to the raw dict if deserialization fails or msg_type is None.
+    ``decoder`` is the subscription's pre-resolved constructor; it is
+    derived from msg_type when not given.  Falls back to the raw dict if
+    deserialization fails or msg_type is None.
     """
     if msg_type is None:
         return msg
 
     data = msg.get("data", msg)
     try:
-        if hasattr(msg_type, "model_validate"):
-            # Pydantic v2 BaseModel
-            return msg_type.model_validate(data)
-        if hasattr(msg_type, "__dataclass_fields__"):
-            # Dataclass: pass matching kwargs
-            fields  = msg_type.__dataclass_fields__
-            kwargs  = {k: v for k, v in data.items() if k in fields}
-            return msg_type(**kwargs)
-        # Fallback: try calling the type directly
-        return msg_type(data)
+        return (decoder or _resolve_decoder(msg_type))(data)
     except Exception:
-        logger.debug("Failed to deserialize %s into %s – passing raw dict", data, msg_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Failed to deserialize %s into %s – passing raw dict", data, msg_type)
         return data
 
 
@@ -163,9 +226,12 @@ class GRVTWebSocketClient:
     async def subscribe(
         self,
         channel:  str,
-        handler:  TypedHandler,
+        handler:  Union[TypedHandler, BatchHandler],
         params:   Optional[dict[str, Any]] = None,
         msg_type: Optional[type[Any]] = None,
+        *,
+        batch_size:    int   = 1,
+        batch_timeout: float = 0.0,
     ) -> None:
         """
         Subscribe to a GRVT WebSocket channel.
@@ -178,9 +244,18 @@ class GRVTWebSocketClient:
                    - If msg_type is set:  receives an instance of msg_type
                      constructed from msg["data"], falling back to the raw
                      dict if construction fails.
+                   - If batch_size > 1: a BatchHandler, receiving a list
+                     of those values.
         params   : Extra subscription parameters passed to the server
         msg_type : Optional dataclass type to deserialize each message into.
                    Example: msg_type=Orderbook
+        batch_size    : If > 1, handler receives a list of up to this many
+                        values (in arrival order) per call.  Messages are
+                        queued and delivered by a per-subscription task,
+                        so a slow handler does not block the receive loop.
+        batch_timeout : Seconds to wait for a batch to fill once its first
+                        message arrives.  The default 0 delivers whatever
+                        is already queued without waiting.
         """
         sub = _Subscription(
             channel=channel,
@@ -188,7 +263,12 @@ class GRVTWebSocketClient:
             handler=handler,
             msg_type=msg_type,
             raw=(msg_type is None),
+            batch_size=batch_size,
+            batch_timeout=batch_timeout,
         )
+        if batch_size > 1:
+            sub.queue = asyncio.Queue()
+            self._start_batch_task(sub)
         self._subscriptions.append(sub)
 
         if self._ws and not self._ws.closed:
@@ -196,6 +276,9 @@ class GRVTWebSocketClient:
 
     async def unsubscribe(self, channel: str) -> None:
         """Remove a subscription and notify the server."""
+        for sub in self._subscriptions:
+            if sub.channel == channel and sub.task is not None:
+                sub.task.cancel()
         self._subscriptions = [s for s in self._subscriptions if s.channel != channel]
         self._seq.pop(channel, None)
 
@@ -220,6 +303,9 @@ class GRVTWebSocketClient:
         """
         self._running = True
         back_off      = _RECONNECT_BASE
+        # close() stops batched delivery; restart it for a reused client
+        for sub in self._subscriptions:
+            self._start_batch_task(sub)
 
         while self._running:
             try:
@@ -238,10 +324,22 @@ class GRVTWebSocketClient:
                 back_off = min(back_off * _RECONNECT_EXP, _RECONNECT_MAX)
 
     async def close(self) -> None:
-        """Gracefully close the WebSocket connection."""
+        """
+        Gracefully close the WebSocket connection.
+
+        Also closes the aiohttp session GRVTAuth keeps for async logins, so a
+        standalone client does not leak it; a later login opens a new one.
+        """
         self._running = False
+        tasks = [sub.task for sub in self._subscriptions if sub.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for sub in self._subscriptions:
+            sub.task = None
         if self._ws and not self._ws.closed:
             await self._ws.close()
+        await self._auth.aclose()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -261,6 +359,7 @@ class GRVTWebSocketClient:
 
         async with websockets.connect(
             url,
+            ssl=_ssl_context() if url.startswith("wss://") else None,
             extra_headers=headers,
             ping_interval=_PING_INTERVAL_S,
             ping_timeout=_PONG_TIMEOUT_S,
@@ -282,8 +381,8 @@ class GRVTWebSocketClient:
         """Receive messages, check sequence gaps, and dispatch to handlers."""
         async for raw in ws:
             try:
-                msg: dict[str, Any] = json.loads(raw)
-            except json.JSONDecodeError:
+                msg: dict[str, Any] = _json.loads(raw)
+            except _json.JSONDecodeError:
                 logger.warning("Received non-JSON WebSocket message: %r", raw)
                 continue
 
@@ -346,13 +445,47 @@ class GRVTWebSocketClient:
             if channel != sub.channel and not channel.startswith(sub.channel):
                 continue
             try:
-                value = _deserialize(msg, sub.msg_type)
-                await sub.handler(value)
+                value = _deserialize(msg, sub.msg_type, sub.decoder)
+                if sub.queue is not None:
+                    sub.queue.put_nowait(value)
+                else:
+                    await sub.handler(value)
             except Exception:
                 logger.exception(
                     "Unhandled exception in WebSocket handler for %s", channel
                 )
 
+    def _start_batch_task(self, sub: _Subscription) -> None:
+        """Start delivery for a batched subscription unless already running."""
+        if sub.queue is not None and sub.task is None:
+            sub.task = asyncio.create_task(self._batch_loop(sub, sub.queue))
+
+    async def _batch_loop(self, sub: _Subscription, queue: asyncio.Queue[Any]) -> None:
+        """Collect queued values for a batched subscription and deliver them as lists."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch    = [await queue.get()]
+            deadline = loop.time() + sub.batch_timeout
+            while len(batch) < sub.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await sub.handler(batch)
+            except Exception:
+                logger.exception(
+                    "Unhandled exception in WebSocket batch handler for %s", sub.channel
+                )
+
 
 # ---------------------------------------------------------------------------
 # Convenience factory
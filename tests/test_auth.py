@@ -0,0 +1,296 @@
+"""
+tests/test_auth.py – Unit tests for GRVTAuth session management.
+
+All tests run offline – login requests go to in-memory fakes.
+They verify:
+  1. async_get_cookie() logs in over a caller-supplied aiohttp session.
+  2. A valid cookie is reused without another login.
+  3. URL properties resolve to the endpoint table for each environment.
+  4. The cookie is treated as expired once inside the refresh buffer.
+  5. The sync path returns the cookie / session without re-authing while valid.
+  6. Logins without a caller session reuse one auth-owned session until aclose().
+  7. The body fallback reads "cookie" / "token" and tolerates non-JSON bodies.
+  8. Sync pools and async connectors share one per-host connection limit.
+  9. Threads racing a stale cookie trigger a single sync login.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from grvt_sdk.auth import (
+    _ENDPOINTS,
+    _POOL_LIMIT_PER_HOST,
+    _REFRESH_BUFFER_S,
+    _SYNC_POOL_MAXSIZE,
+    GRVTAuth,
+    GRVTEnv,
+    _async_connector,
+    _cookie_from_body,
+    _SessionState,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeResponse:
+    def __init__(self, cookie: str, body: bytes = b"{}") -> None:
+        self.status  = 200
+        self.cookies = {"exchange_token": SimpleNamespace(value=cookie)} if cookie else {}
+        self._body   = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> _FakeResponse:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class _FakeSession:
+    """Records login POSTs; stands in for aiohttp.ClientSession."""
+
+    def __init__(self, cookie: str = "tok-1", body: bytes = b"{}") -> None:
+        self.cookie = cookie
+        self.body   = body
+        self.closed = False
+        self.posts: list[str] = []
+        self.sent:  list[Any] = []
+
+    def post(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.posts.append(url)
+        self.sent.append(kwargs.get("data"))
+        return _FakeResponse(self.cookie, self.body)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSyncSession:
+    """Stands in for requests.Session; the login sets the cookie in its jar."""
+
+    def __init__(self, cookie: str = "tok-sync") -> None:
+        self.cookie  = cookie
+        self.cookies: dict[str, str] = {}
+        self.posts:   list[str] = []
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+    def post(self, url: str, **_: Any) -> SimpleNamespace:
+        self.posts.append(url)
+        self.cookies["exchange_token"] = self.cookie
+        return SimpleNamespace(raise_for_status=lambda: None, content=b"{}", text="{}")
+
+
+def _make_auth() -> GRVTAuth:
+    return GRVTAuth(api_key="test-key", env=GRVTEnv.TESTNET)
+
+
+# ---------------------------------------------------------------------------
+# Async login
+# ---------------------------------------------------------------------------
+
+class TestAsyncGetCookie:
+    @pytest.mark.asyncio
+    async def test_logs_in_over_supplied_session(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession()
+        cookie  = await auth.async_get_cookie(session=session)
+        assert cookie == "tok-1"
+        assert session.posts == [auth.edge_url + "/auth/api_key/login"]
+
+    @pytest.mark.asyncio
+    async def test_login_body_is_prebuilt_json(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession()
+        await auth.async_get_cookie(session=session)
+        assert json.loads(session.sent[0]) == {"api_key": "test-key"}
+
+    @pytest.mark.asyncio
+    async def test_token_read_from_body_without_cookie(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession(cookie="", body=b'{"token": "tok-body"}')
+        assert await auth.async_get_cookie(session=session) == "tok-body"
+
+    @pytest.mark.asyncio
+    async def test_lock_created_on_first_refresh(self) -> None:
+        auth = _make_auth()
+        assert auth._async_lock is None
+        await auth.async_get_cookie(session=_FakeSession())
+        assert auth._async_lock is not None
+
+    def test_constructed_outside_a_loop(self) -> None:
+        # No loop is running here; each asyncio.run() below starts a new one.
+        auth    = _make_auth()
+        session = _FakeSession()
+        assert asyncio.run(auth.async_get_cookie(session=session)) == "tok-1"
+        auth.invalidate()
+        assert asyncio.run(auth.async_get_cookie(session=session)) == "tok-1"
+        assert len(session.posts) == 2
+
+    @pytest.mark.asyncio
+    async def test_valid_cookie_not_refreshed(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession()
+        await auth.async_get_cookie(session=session)
+        await auth.async_get_cookie(session=session)
+        assert len(session.posts) == 1
+
+
+class TestSyncGetCookie:
+    def test_logs_in_once_while_valid(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSyncSession()
+        auth._session = session  # type: ignore[assignment]
+        assert auth.get_cookie() == "tok-sync"
+        assert auth.get_cookie() == "tok-sync"
+        assert len(session.posts) == 1
+
+    def test_concurrent_threads_log_in_once(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSyncSession()
+        auth._session = session  # type: ignore[assignment]
+        post    = session.post
+
+        def slow_post(url: str, **kw: Any) -> SimpleNamespace:
+            time.sleep(0.02)        # widen the race window
+            return post(url, **kw)
+
+        session.post = slow_post  # type: ignore[method-assign]
+        threads = [threading.Thread(target=auth.get_cookie) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(session.posts) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_session_after_async_login(self) -> None:
+        # An async-only login leaves no requests.Session; get_session() must
+        # log in on the sync path rather than fail.
+        auth = _make_auth()
+        await auth.async_get_cookie(session=_FakeSession())
+        assert auth._session is None
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("grvt_sdk.auth.requests.Session", _FakeSyncSession)
+            session = auth.get_session()
+        assert session.cookies["exchange_token"] == "tok-sync"
+
+
+class TestSyncSessionPool:
+    def test_https_adapter_is_pooled(self) -> None:
+        adapter = _make_auth()._http_session().get_adapter("https://trades.grvt.io")
+        assert adapter._pool_maxsize == _SYNC_POOL_MAXSIZE  # type: ignore[attr-defined]
+
+    def test_session_reused(self) -> None:
+        auth = _make_auth()
+        assert auth._http_session() is auth._http_session()
+
+    @pytest.mark.asyncio
+    async def test_async_connector_matches_sync_pool(self) -> None:
+        connector = _async_connector()
+        try:
+            assert connector.limit_per_host == _POOL_LIMIT_PER_HOST == _SYNC_POOL_MAXSIZE
+        finally:
+            await connector.close()
+
+
+class TestOwnedSession:
+    @pytest.mark.asyncio
+    async def test_refreshes_reuse_owned_session(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession()
+        auth._aiohttp_session = session
+        await auth.async_get_cookie()
+        auth.invalidate()
+        await auth.async_get_cookie()
+        assert len(session.posts) == 2
+        assert auth._aiohttp_session is session
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_owned_session(self) -> None:
+        auth    = _make_auth()
+        session = _FakeSession()
+        auth._aiohttp_session = session
+        await auth.aclose()
+        assert session.closed is True
+        assert auth._aiohttp_session is None
+
+
+class TestCookieFromBody:
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (b'{"cookie": "c"}', "c"),
+            (b'{"token": "t"}', "t"),
+            (b'{"other": 1}', ""),
+            (b"[]", ""),
+            (b"not json", ""),
+        ],
+    )
+    def test_fallback_parsing(self, raw: bytes, expected: str) -> None:
+        assert _cookie_from_body(raw) == expected
+
+    @pytest.mark.asyncio
+    async def test_missing_cookie_raises(self) -> None:
+        with pytest.raises(RuntimeError, match="no session cookie"):
+            await _make_auth().async_get_cookie(session=_FakeSession(cookie="", body=b"{}"))
+
+
+# ---------------------------------------------------------------------------
+# Endpoint resolution
+# ---------------------------------------------------------------------------
+
+class TestEndpoints:
+    @pytest.mark.parametrize("env", [GRVTEnv.TESTNET, GRVTEnv.MAINNET, GRVTEnv.DEV])
+    def test_urls_match_endpoint_table(self, env: GRVTEnv) -> None:
+        auth  = GRVTAuth(api_key="k", env=env)
+        table = _ENDPOINTS[env.label]
+        assert auth.edge_url      == table.edge
+        assert auth.base_url      == table.rest
+        assert auth.market_url    == table.market
+        assert auth.ws_trades_url == table.ws_trades
+        assert auth.ws_market_url == table.ws_market
+
+    def test_string_env_resolves_like_enum(self) -> None:
+        assert GRVTAuth(api_key="k", env="MAINNET").base_url == GRVTAuth(
+            api_key="k", env=GRVTEnv.MAINNET
+        ).base_url
+
+    @pytest.mark.parametrize("name", ["mainnet", "MAINNET", "Mainnet"])
+    def test_string_env_normalised_to_enum(self, name: str) -> None:
+        assert GRVTAuth(api_key="k", env=name).env is GRVTEnv.MAINNET
+
+    def test_unknown_env_raises(self) -> None:
+        with pytest.raises(ValueError, match="staging"):
+            GRVTAuth(api_key="k", env="staging")
+
+
+# ---------------------------------------------------------------------------
+# Proactive refresh window
+# ---------------------------------------------------------------------------
+
+class TestIsValid:
+    def test_no_state_is_invalid(self) -> None:
+        assert _make_auth()._is_valid() is False
+
+    def test_valid_until_refresh_buffer(self) -> None:
+        auth        = _make_auth()
+        auth._state = _SessionState("tok", expires_at=time.monotonic() + _REFRESH_BUFFER_S + 60)
+        assert auth._is_valid() is True
+
+    def test_invalid_inside_refresh_buffer(self) -> None:
+        auth        = _make_auth()
+        auth._state = _SessionState("tok", expires_at=time.monotonic() + _REFRESH_BUFFER_S - 1)
+        assert auth._is_valid() is False
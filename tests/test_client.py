@@ -36,6 +36,10 @@ class TestGRVTClientConstruction:
         client = GRVTClient(api_key="test-key", env=GRVTEnv.MAINNET)
         assert client.env == GRVTEnv.MAINNET
 
+    def test_string_env_forwarded_as_enum(self) -> None:
+        client = GRVTClient(api_key="test-key", env="mainnet")
+        assert client.env is GRVTEnv.MAINNET
+
     def test_default_env_is_testnet(self) -> None:
         client = GRVTClient(api_key="test-key")
         assert client.env == GRVTEnv.TESTNET
@@ -0,0 +1,54 @@
+"""
+tests/test_json.py – Tests for the shared JSON codec (grvt_sdk._json).
+
+All tests run offline.  They verify:
+  1. dumps() returns compact UTF-8 bytes that round-trip through loads().
+  2. loads() accepts the raw response bytes as well as str.
+  3. Decode errors are catchable as the stdlib json.JSONDecodeError.
+  4. Without orjson the stdlib fallback produces byte-identical output.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from grvt_sdk import _json
+
+_DOC = {"sub_account_id": "99", "legs": [{"size": "0.01", "is_buying_asset": True}], "n": None}
+
+
+class TestCodec:
+    def test_dumps_compact_bytes(self) -> None:
+        out = _json.dumps(_DOC)
+        assert isinstance(out, bytes)
+        assert out == json.dumps(_DOC, separators=(",", ":")).encode()
+
+    @pytest.mark.parametrize("raw", [json.dumps(_DOC).encode(), json.dumps(_DOC)])
+    def test_loads_bytes_and_str(self, raw: bytes | str) -> None:
+        assert _json.loads(raw) == _DOC
+
+    def test_decode_error_is_stdlib_type(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"not json")
+
+
+class TestStdlibFallback:
+    def test_fallback_output_matches(self) -> None:
+        # Fresh interpreter with orjson made unimportable
+        code = (
+            "import sys\n"
+            "sys.modules['orjson'] = None\n"
+            "from grvt_sdk import _json\n"
+            f"doc = {_DOC!r}\n"
+            "assert not _json.HAS_ORJSON\n"
+            "assert _json.loads(_json.dumps(doc)) == doc\n"
+            "sys.stdout.write(_json.dumps(doc).decode())\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.encode() == _json.dumps(_DOC)
@@ -0,0 +1,59 @@
+"""
+tests/test_package.py – Tests for the top-level grvt_sdk namespace.
+
+All tests run offline.  They verify:
+  1. ``import grvt_sdk`` does not eagerly import heavy dependencies.
+  2. Public names resolve lazily to the right submodule objects.
+  3. Unknown attributes raise AttributeError.
+  4. __all__ and the lazy-import table list exactly the same names, once each.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import grvt_sdk
+
+_HEAVY_MODULES = ("pydantic", "aiohttp", "requests", "websockets", "eth_account")
+
+
+class TestLazyImports:
+    def test_bare_import_loads_no_heavy_dependencies(self) -> None:
+        # Fresh interpreter: this process has already imported everything.
+        code = (
+            "import sys, grvt_sdk\n"
+            f"print([m for m in {_HEAVY_MODULES!r} if m in sys.modules])\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        assert out == "[]"
+
+    def test_names_resolve_to_submodule_objects(self) -> None:
+        from grvt_sdk.client import GRVTClient
+        from grvt_sdk.signing import sign_order
+
+        assert grvt_sdk.GRVTClient is GRVTClient
+        assert grvt_sdk.sign_order is sign_order
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            grvt_sdk.no_such_name  # noqa: B018
+
+    def test_dir_lists_public_names(self) -> None:
+        assert set(grvt_sdk.__all__) <= set(dir(grvt_sdk))
+
+
+class TestPublicNamespace:
+    def test_all_matches_lazy_table(self) -> None:
+        assert sorted(grvt_sdk.__all__) == sorted(grvt_sdk._LAZY)
+
+    def test_no_duplicate_exports(self) -> None:
+        assert len(grvt_sdk.__all__) == len(set(grvt_sdk.__all__))
+
+    @pytest.mark.parametrize("name", sorted(grvt_sdk._LAZY))
+    def test_every_name_resolves(self, name: str) -> None:
+        assert getattr(grvt_sdk, name) is not None
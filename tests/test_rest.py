@@ -0,0 +1,628 @@
+"""
+tests/test_rest.py – Unit tests for the REST clients' request plumbing.
+
+All tests run offline – HTTP sessions are replaced by in-memory fakes.
+They verify:
+  1. Public calls on the sync client reuse one pooled session.
+  2. close() / the context manager release the pooled connections.
+  3. Request bodies are pre-encoded JSON bytes; responses are decoded from bytes.
+  4. Order and instrument lists are validated from the raw response bytes,
+     and get_order() behaves the same on both clients.
+  5. The async client's pooled session carries the request timeout.
+  6. Sync and async batch helpers keep input order and respect max_inflight.
+  7. Retry delays follow the schedule, honour Retry-After and add jitter.
+  8. URLs and private headers are built once and reused until the cookie changes.
+  9. The async client retries retryable statuses, reusing the encoded body,
+    and raises on the last one.
+ 10. CancelCoalescer dedupes a burst, routes errors and never strands a waiter.
+ 11. AsyncClientPool lends clients LIFO and resets them after transport errors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from grvt_sdk.auth import _SYNC_POOL_MAXSIZE, GRVTAuth, GRVTEnv, _SessionState
+from grvt_sdk.rest import (
+    _RETRY_AFTER_MAX_S,
+    _RETRY_DELAYS,
+    _RETRY_JITTER_S,
+    AsyncClientPool,
+    AsyncGRVTRestClient,
+    CancelCoalescer,
+    GRVTAPIError,
+    GRVTRestClient,
+    _retry_delay,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeSession:
+    """Records requests; stands in for requests.Session."""
+
+    def __init__(self, body: Any = None) -> None:
+        self.body     = body if body is not None else {"result": {}}
+        self.requests: list[tuple[str, str]] = []
+        self.sent:     list[Any] = []
+        self.closed   = False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> SimpleNamespace:
+        self.requests.append((method, url))
+        self.sent.append(kwargs.get("data"))
+        return SimpleNamespace(status_code=200, text="", content=json.dumps(self.body).encode())
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _make_client() -> GRVTRestClient:
+    return GRVTRestClient(GRVTAuth(api_key="test-key", env=GRVTEnv.TESTNET))
+
+
+def _authed_client(session: _FakeSession) -> GRVTRestClient:
+    """Client whose auth is already logged in over ``session``."""
+    client = _make_client()
+    client._auth._session = session  # type: ignore[assignment]
+    client._auth._state   = _SessionState("tok", expires_at=time.monotonic() + 3600)
+    return client
+
+
+_ORDER = {
+    "sub_account_id": "99",
+    "time_in_force": 1,
+    "expiration": "1000000000",
+    "legs": [{
+        "instrument": "0x" + "ab" * 32,
+        "size": "0.01",
+        "limit_price": "50000.0",
+        "is_buying_asset": True,
+    }],
+    "metadata": {"client_order_id": 1, "create_time": "1700000000000000000"},
+    "order_id": "ord-1",
+}
+
+
+# ---------------------------------------------------------------------------
+# Sync client: public session
+# ---------------------------------------------------------------------------
+
+class TestPublicSession:
+    def test_public_session_is_pooled(self) -> None:
+        adapter = _make_client()._public_session.get_adapter("https://market-data.grvt.io")
+        assert adapter._pool_maxsize == _SYNC_POOL_MAXSIZE  # type: ignore[attr-defined]
+
+    def test_public_calls_reuse_one_session(self) -> None:
+        client  = _make_client()
+        session = _FakeSession()
+        client._public_session = session  # type: ignore[assignment]
+        client.get_instruments()
+        client.get_instruments()
+        assert len(session.requests) == 2
+        assert session.requests[0][1] == client._auth.market_url + "/full/v1/instruments"
+
+    def test_public_calls_skip_auth_session(self) -> None:
+        # Market data must neither log in nor carry the session cookie
+        client = _make_client()
+        client._public_session = _FakeSession()  # type: ignore[assignment]
+        client.get_instruments()
+        assert client._auth._session is None
+        assert client._auth._state is None
+
+    def test_body_encoded_once_as_bytes(self) -> None:
+        client  = _make_client()
+        session = _FakeSession(body={"result": {"instruments": []}})
+        client._public_session = session  # type: ignore[assignment]
+        assert client.get_instruments() == []
+        assert isinstance(session.sent[0], bytes)
+        assert json.loads(session.sent[0]) == {"is_active": [True]}
+
+    def test_instruments_validated_from_bytes(self) -> None:
+        client  = _make_client()
+        inst    = {"instrument": "BTC_USDT_Perp", "instrument_hash": "0x" + "ab" * 32,
+                   "base": "BTC", "quote": "USDT", "kind": 1}
+        client._public_session = _FakeSession(  # type: ignore[assignment]
+            body={"result": {"instruments": [inst, {**inst, "instrument": "ETH_USDT_Perp"}]}},
+        )
+        names = [i.instrument for i in client.get_instruments()]
+        assert names == ["BTC_USDT_Perp", "ETH_USDT_Perp"]
+
+    def test_context_manager_closes_sessions(self) -> None:
+        client  = _make_client()
+        session = _FakeSession()
+        client._public_session = session  # type: ignore[assignment]
+        with client:
+            pass
+        assert session.closed is True
+
+
+# ---------------------------------------------------------------------------
+# Sync client: order lists
+# ---------------------------------------------------------------------------
+
+class TestOrderLists:
+    def test_open_orders_parsed(self) -> None:
+        session = _FakeSession(body={"result": {"open_orders": [_ORDER, _ORDER]}})
+        orders  = _authed_client(session).get_open_orders(99)
+        assert [o.order_id for o in orders] == ["ord-1", "ord-1"]
+        assert orders[0].sub_account_id == 99
+
+    def test_get_order_not_found(self) -> None:
+        session = _FakeSession(body={"result": {"orders": []}})
+        with pytest.raises(GRVTAPIError, match="not found"):
+            _authed_client(session).get_order(99, "missing")
+
+    def test_large_lists_never_decoded_to_dicts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Order and trade lists go bytes -> models; the generic JSON decode
+        # (a full dict tree per element) must not run for them.
+        def _no_loads(_: Any) -> Any:
+            raise AssertionError("list response decoded to dicts")
+
+        monkeypatch.setattr("grvt_sdk.rest._json.loads", _no_loads)
+        trade   = {"trade_id": "t", "price": "1", "size": "1", "is_taker_buyer": True, "created_time": "1"}
+        session = _FakeSession(body={"result": {"open_orders": [_ORDER] * 50, "trades": [trade] * 50}})
+        client  = _authed_client(session)
+        client._public_session = session  # type: ignore[assignment]
+        assert len(client.get_open_orders(99)) == 50
+        assert len(client.get_recent_trades("BTC_USDT_Perp")) == 50
+
+
+# ---------------------------------------------------------------------------
+# Sync client: batch submission
+# ---------------------------------------------------------------------------
+
+class TestSyncCreateOrders:
+    def test_results_in_input_order_and_bounded(self) -> None:
+        client   = _authed_client(_FakeSession())
+        lock     = threading.Lock()
+        inflight = peak = 0
+
+        def create_order(order: Any) -> Any:
+            nonlocal inflight, peak
+            with lock:
+                inflight += 1
+                peak      = max(peak, inflight)
+            time.sleep(0.01)
+            with lock:
+                inflight -= 1
+            return order
+
+        client.create_order = create_order  # type: ignore[method-assign]
+        orders = [f"o{i}" for i in range(6)]
+        assert client.create_orders(orders, max_inflight=2) == orders  # type: ignore[arg-type]
+        assert peak == 2
+
+    def test_failure_stops_remaining_sends(self) -> None:
+        client = _authed_client(_FakeSession())
+        lock   = threading.Lock()
+        sent: list[str] = []
+
+        def create_order(order: Any) -> Any:
+            with lock:
+                sent.append(order)
+            if order == "o2":
+                raise GRVTAPIError(400, "rejected")
+            time.sleep(0.01)
+            return order
+
+        client.create_order = create_order  # type: ignore[method-assign]
+        orders = [f"o{i}" for i in range(10)]
+        with pytest.raises(GRVTAPIError, match="rejected"):
+            client.create_orders(orders, max_inflight=2)  # type: ignore[arg-type]
+        # o2 fails at once while at most one other order is in flight;
+        # nothing queued behind it may be sent.
+        assert sorted(sent[:3]) == ["o0", "o1", "o2"]
+        assert len(sent) <= 4
+
+    def test_empty_batch_skips_login(self) -> None:
+        client = _make_client()
+        assert client.create_orders([]) == []
+        assert client._auth._state is None
+
+    def test_invalid_max_inflight_rejected(self) -> None:
+        with pytest.raises(ValueError, match="max_inflight"):
+            _make_client().create_orders([], max_inflight=0)
+
+
+# ---------------------------------------------------------------------------
+# Async client: order lookup
+# ---------------------------------------------------------------------------
+
+class TestAsyncOrderLookup:
+    @pytest.mark.asyncio
+    async def test_get_order_not_found(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+
+        async def _request(*_: Any, **__: Any) -> bytes:
+            return b'{"result": {"orders": []}}'
+
+        monkeypatch.setattr(client, "_request", _request)
+        with pytest.raises(GRVTAPIError, match="not found"):
+            await client.get_order(99, "missing")
+
+    @pytest.mark.asyncio
+    async def test_get_order_parsed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+
+        async def _request(*_: Any, **__: Any) -> bytes:
+            return json.dumps({"result": {"orders": [_ORDER]}}).encode()
+
+        monkeypatch.setattr(client, "_request", _request)
+        assert (await client.get_order(99, "ord-1")).order_id == "ord-1"
+
+
+# ---------------------------------------------------------------------------
+# Async client: pooled session
+# ---------------------------------------------------------------------------
+
+class TestAsyncSession:
+    @pytest.mark.asyncio
+    async def test_session_timeout_set_once(self) -> None:
+        client  = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"), timeout=5.0)
+        session = client._open_session()
+        try:
+            assert client._session is session
+            assert session.timeout.total == 5.0
+        finally:
+            await client.close()
+
+
+# ---------------------------------------------------------------------------
+# URL / header caches
+# ---------------------------------------------------------------------------
+
+class _FakeAsyncResponse:
+    def __init__(self, status: int = 200) -> None:
+        self.status  = status
+        self.headers: dict[str, str] = {}
+
+    async def text(self) -> str:
+        return "error"
+
+    async def read(self) -> bytes:
+        return b'{"result": {}}'
+
+    async def __aenter__(self) -> _FakeAsyncResponse:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class _FakeAsyncSession:
+    """Records (url, headers) per request; stands in for aiohttp.ClientSession."""
+
+    closed = False
+
+    def __init__(self, statuses: tuple[int, ...] = ()) -> None:
+        self.statuses = list(statuses)
+        self.calls: list[tuple[str, Any]] = []
+        self.sent:  list[Any] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _FakeAsyncResponse:
+        self.calls.append((url, kwargs.get("headers")))
+        self.sent.append(kwargs.get("data"))
+        return _FakeAsyncResponse(self.statuses.pop(0) if self.statuses else 200)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestRequestCaches:
+    def test_sync_url_built_once(self) -> None:
+        client  = _make_client()
+        client._public_session = _FakeSession()  # type: ignore[assignment]
+        client.get_instruments()
+        url = client._auth.market_url + "/full/v1/instruments"
+        assert client._urls == {(True, "/full/v1/instruments"): url}
+
+    @pytest.mark.asyncio
+    async def test_private_headers_reused_until_cookie_changes(self) -> None:
+        auth    = GRVTAuth(api_key="test-key", env=GRVTEnv.TESTNET)
+        auth._state = _SessionState("tok-1", expires_at=time.monotonic() + 3600)
+        client  = AsyncGRVTRestClient(auth)
+        session = _FakeAsyncSession()
+        client._session = session
+        await client._request("POST", "/full/v1/cancel_order")
+        await client._request("POST", "/full/v1/cancel_order")
+        auth._state = _SessionState("tok-2", expires_at=time.monotonic() + 3600)
+        await client._request("POST", "/full/v1/cancel_order")
+        (url, first), (_, second), (_, third) = session.calls
+        assert url == auth.base_url + "/full/v1/cancel_order"
+        assert first is second
+        assert third["Cookie"] == "exchange_token=tok-2"
+
+
+# ---------------------------------------------------------------------------
+# Async client: batch helpers
+# ---------------------------------------------------------------------------
+
+class TestBatchHelpers:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_and_bounded(self) -> None:
+        client   = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        inflight = peak = 0
+
+        async def get_orderbook(instrument: str, depth: int = 10) -> str:
+            nonlocal inflight, peak
+            inflight += 1
+            peak      = max(peak, inflight)
+            # Later instruments finish first
+            await asyncio.sleep(0.01 / (1 + int(instrument[-1])))
+            inflight -= 1
+            return instrument
+
+        client.get_orderbook = get_orderbook  # type: ignore[method-assign]
+        names = [f"I{i}" for i in range(6)]
+        books = await client.get_orderbooks(names, max_inflight=2)
+        assert books == names
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_orders_forwards_sub_account(self) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        calls: list[tuple[int, str]] = []
+
+        async def cancel_order(sub_account_id: int, order_id: str) -> str:
+            calls.append((sub_account_id, order_id))
+            return order_id
+
+        client.cancel_order = cancel_order  # type: ignore[method-assign]
+        assert await client.cancel_orders(7, ["a", "b"]) == ["a", "b"]
+        assert calls == [(7, "a"), (7, "b")]
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_remaining_sends(self) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        sent: list[str] = []
+
+        async def cancel_order(sub_account_id: int, order_id: str) -> str:
+            sent.append(order_id)
+            await asyncio.sleep(0)
+            if order_id == "o2":
+                raise GRVTAPIError(400, "rejected")
+            return order_id
+
+        client.cancel_order = cancel_order  # type: ignore[method-assign]
+        ids = [f"o{i}" for i in range(10)]
+        with pytest.raises(GRVTAPIError, match="rejected"):
+            await client.cancel_orders(1, ids, max_inflight=2)
+        # o2 fails while at most one other call is in flight; nothing queued
+        # behind it may be sent.
+        assert sent[:3] == ["o0", "o1", "o2"]
+        assert len(sent) <= 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_inflight_rejected(self) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        with pytest.raises(ValueError, match="max_inflight"):
+            await client.create_orders([], max_inflight=0)
+
+
+# ---------------------------------------------------------------------------
+# Retry back-off
+# ---------------------------------------------------------------------------
+
+class TestRetryDelay:
+    @pytest.mark.parametrize("attempt", range(len(_RETRY_DELAYS)))
+    def test_schedule_plus_jitter(self, attempt: int) -> None:
+        delay = _retry_delay(attempt, None)
+        assert _RETRY_DELAYS[attempt] <= delay <= _RETRY_DELAYS[attempt] + _RETRY_JITTER_S
+
+    def test_retry_after_seconds_raises_delay(self) -> None:
+        assert 2.0 <= _retry_delay(0, "2") <= 2.0 + _RETRY_JITTER_S
+
+    def test_short_retry_after_keeps_schedule(self) -> None:
+        assert _retry_delay(2, "0") >= _RETRY_DELAYS[2]
+
+    def test_retry_after_capped(self) -> None:
+        assert _retry_delay(0, "3600") <= _RETRY_AFTER_MAX_S + _RETRY_JITTER_S
+
+    def test_retry_after_http_date(self) -> None:
+        from email.utils import formatdate
+        delay = _retry_delay(0, formatdate(time.time() + 5, usegmt=True))
+        assert 3.0 <= delay <= 5.0 + _RETRY_JITTER_S
+
+    def test_zoneless_http_date_read_as_utc(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # "-0000" yields a naive datetime; it must still mean GMT, not the
+        # local zone (forced off UTC here so a misread shows up)
+        monkeypatch.setenv("TZ", "EST+05")
+        time.tzset()
+        try:
+            when  = time.strftime("%a, %d %b %Y %H:%M:%S -0000", time.gmtime(time.time() + 5))
+            delay = _retry_delay(0, when)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert 3.0 <= delay <= 5.0 + _RETRY_JITTER_S
+
+    def test_unparseable_retry_after_ignored(self) -> None:
+        assert _retry_delay(0, "soon") <= _RETRY_DELAYS[0] + _RETRY_JITTER_S
+
+
+class TestAsyncRetry:
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("grvt_sdk.rest._retry_delay", lambda *_: 0.0)
+        client  = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        session = _FakeAsyncSession(statuses=(503, 429))
+        client._session = session
+        assert await client._request("POST", "/full/v1/book", public=True) == {"result": {}}
+        assert len(session.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_body_encoded_once_across_retries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("grvt_sdk.rest._retry_delay", lambda *_: 0.0)
+        client  = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        session = _FakeAsyncSession(statuses=(503, 503))
+        client._session = session
+        await client._request("POST", "/full/v1/book", json={"instrument": "X"}, public=True)
+        first = session.sent[0]
+        assert isinstance(first, bytes)
+        assert all(sent is first for sent in session.sent)   # same buffer, no re-encode
+
+    @pytest.mark.asyncio
+    async def test_raises_after_last_retry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("grvt_sdk.rest._retry_delay", lambda *_: 0.0)
+        client  = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+        session = _FakeAsyncSession(statuses=(503,) * (len(_RETRY_DELAYS) + 1))
+        client._session = session
+        with pytest.raises(GRVTAPIError) as exc:
+            await client._request("POST", "/full/v1/book", public=True)
+        assert exc.value.status_code == 503
+        assert len(session.calls) == len(_RETRY_DELAYS) + 1
+
+
+# ---------------------------------------------------------------------------
+# Cancel coalescing
+# ---------------------------------------------------------------------------
+
+class TestCancelCoalescer:
+    @staticmethod
+    def _client(calls: list[tuple[int, str]]) -> AsyncGRVTRestClient:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+
+        async def cancel_order(sub_account_id: int, order_id: str) -> Any:
+            calls.append((sub_account_id, order_id))
+            if order_id == "bad":
+                raise GRVTAPIError(400, "unknown order")
+            return SimpleNamespace(order_id=order_id)
+
+        client.cancel_order = cancel_order  # type: ignore[method-assign]
+        return client
+
+    @pytest.mark.asyncio
+    async def test_burst_dispatched_once_per_order(self) -> None:
+        calls: list[tuple[int, str]] = []
+        coalescer = CancelCoalescer(self._client(calls))
+        results = await asyncio.gather(
+            coalescer.cancel_order(7, "a"),
+            coalescer.cancel_order(7, "b"),
+            coalescer.cancel_order(7, "a"),
+        )
+        assert [r.order_id for r in results] == ["a", "b", "a"]
+        assert sorted(calls) == [(7, "a"), (7, "b")]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_only_its_caller(self) -> None:
+        coalescer = CancelCoalescer(self._client([]))
+        ok, bad = await asyncio.gather(
+            coalescer.cancel_order(7, "a"),
+            coalescer.cancel_order(7, "bad"),
+            return_exceptions=True,
+        )
+        assert ok.order_id == "a"
+        assert isinstance(bad, GRVTAPIError)
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_pending(self) -> None:
+        calls: list[tuple[int, str]] = []
+        coalescer = CancelCoalescer(self._client(calls), window=60.0)
+        waiter    = asyncio.ensure_future(coalescer.cancel_order(7, "a"))
+        await asyncio.sleep(0)
+        await coalescer.aclose()
+        assert (await waiter).order_id == "a"
+        assert calls == [(7, "a")]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_dispatch_cancels_waiters(self) -> None:
+        client = AsyncGRVTRestClient(GRVTAuth(api_key="test-key"))
+
+        async def cancel_order(sub_account_id: int, order_id: str) -> Any:
+            await asyncio.sleep(60)
+
+        client.cancel_order = cancel_order  # type: ignore[method-assign]
+        coalescer = CancelCoalescer(client, window=0.0)
+        waiters   = [asyncio.ensure_future(coalescer.cancel_order(7, oid)) for oid in "ab"]
+        await asyncio.sleep(0.01)
+        for task in coalescer._tasks:
+            task.cancel()
+        for waiter in waiters:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, 1.0)
+
+    def test_invalid_max_inflight_rejected(self) -> None:
+        with pytest.raises(ValueError, match="max_inflight"):
+            CancelCoalescer(self._client([]), max_inflight=0)
+
+
+# ---------------------------------------------------------------------------
+# Client pool
+# ---------------------------------------------------------------------------
+
+class TestAsyncClientPool:
+    @pytest.mark.asyncio
+    async def test_lifo_and_shared_auth(self) -> None:
+        auth = GRVTAuth(api_key="test-key")
+        pool = AsyncClientPool(auth, size=2)
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+        async with pool.acquire() as again:
+            assert again is first
+        assert first._auth is second._auth is auth
+
+    @pytest.mark.asyncio
+    async def test_waits_when_exhausted(self) -> None:
+        pool  = AsyncClientPool(GRVTAuth(api_key="test-key"), size=1)
+        order: list[str] = []
+
+        async def worker(name: str) -> None:
+            async with pool.acquire():
+                order.append(f"{name}+")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}-")
+
+        await asyncio.gather(worker("a"), worker("b"))
+        assert order == ["a+", "a-", "b+", "b-"]
+
+    @pytest.mark.asyncio
+    async def test_transport_error_closes_session(self) -> None:
+        pool = AsyncClientPool(GRVTAuth(api_key="test-key"), size=1)
+        with pytest.raises(ConnectionError):
+            async with pool.acquire() as client:
+                client._session = session = _FakeAsyncSession()
+                raise ConnectionError
+        assert session.closed is True
+        assert client._session is None
+        async with pool.acquire() as again:
+            assert again is client
+
+    @pytest.mark.asyncio
+    async def test_api_error_keeps_session(self) -> None:
+        pool = AsyncClientPool(GRVTAuth(api_key="test-key"), size=1)
+        with pytest.raises(GRVTAPIError):
+            async with pool.acquire() as client:
+                client._session = session = _FakeAsyncSession()
+                raise GRVTAPIError(400, "bad order")
+        assert client._session is session
+
+    @pytest.mark.asyncio
+    async def test_caller_error_keeps_session(self) -> None:
+        pool = AsyncClientPool(GRVTAuth(api_key="test-key"), size=1)
+        with pytest.raises(KeyError):
+            async with pool.acquire() as client:
+                client._session = session = _FakeAsyncSession()
+                raise KeyError("bug in the caller, not the socket")
+        assert session.closed is False
+        assert client._session is session
+
+    @pytest.mark.asyncio
+    async def test_timeout_closes_session(self) -> None:
+        pool = AsyncClientPool(GRVTAuth(api_key="test-key"), size=1)
+        with pytest.raises(asyncio.TimeoutError):
+            async with pool.acquire() as client:
+                client._session = session = _FakeAsyncSession()
+                raise asyncio.TimeoutError
+        assert session.closed is True
+
+    def test_invalid_size_rejected(self) -> None:
+        with pytest.raises(ValueError, match="size"):
+            AsyncClientPool(GRVTAuth(api_key="test-key"), size=0)
@@ -9,16 +9,54 @@ They verify that:
   4. The nonce default path works.
   5. NonceProvider protocol is respected.
   6. post_only / reduce_only are read from the Order dataclass.
+  7. OrderSigner produces the same signatures as sign_order().
+  8. The cached signable message matches eth_account's encode_typed_data().
+  9. The hand-packed Order struct hash matches eth_account's for varied orders,
+     and leg hashes are reused across nonces.
+ 10. The domain separator is hashed once per chain ID / contract, not per order,
+     and no generic typed-data encoding runs per sign.
+ 11. sign_orders() matches sign_order() and draws one nonce per order.
+ 12. SequenceNonce counts up from the clock, wraps at uint32 and is thread-safe.
 """
 
 from __future__ import annotations
 
+import threading
 import time
 
 import pytest
+from eth_abi import encode as abi_encode
 from eth_account import Account
-
-from grvt_sdk.signing import sign_order, recover_signer, build_eip712_domain
+from eth_account.messages import (  # type: ignore[attr-defined]
+    encode_typed_data,
+    hash_domain,
+    hash_eip712_message,
+)
+from eth_hash.auto import keccak
+
+from grvt_sdk.signing import (
+    _EIP712_TYPES,
+    _FALSE_WORD,
+    _LEG_TYPEHASH,
+    _TRUE_WORD,
+    OrderSigner,
+    SequenceNonce,
+    _build_order_message,
+    _default_nonce,
+    _domain_hash,
+    _encode_leg,
+    _hash_order,
+    _instrument_word,
+    _int_word,
+    _leg_hash,
+    _signable,
+    _uint_word,
+    build_eip712_domain,
+    make_signer,
+    recover_signer,
+    sign_order,
+    sign_orders,
+)
 from grvt_sdk.types import Order, OrderLeg, OrderMetadata, TimeInForce
 
 
@@ -33,6 +71,9 @@ TEST_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4
 CHAIN_ID           = 326
 VERIFYING_CONTRACT = "0x0000000000000000000000000000000000000001"  # placeholder
 
+# Order/OrderLeg types without the domain, as eth_account's hashing expects
+_MESSAGE_TYPES = {k: v for k, v in _EIP712_TYPES.items() if k != "EIP712Domain"}
+
 
 def _make_order(
     expiration: int = 4_000_000_000_000_000_000,  # ~2096, within int64 range
@@ -78,6 +119,35 @@ class TestBuildDomain:
         assert domain["name"] == "My Exchange"
         assert domain["version"] == "2"
 
+    def test_domain_hash_cached(self) -> None:
+        assert _domain_hash(CHAIN_ID, VERIFYING_CONTRACT) is _domain_hash(CHAIN_ID, VERIFYING_CONTRACT)
+
+    @pytest.mark.parametrize(
+        "chain_id, contract",
+        [
+            (CHAIN_ID, VERIFYING_CONTRACT),
+            (1, "0x" + "ab" * 20),
+            (2**64, "0x00000000000000000000000000000000DeaDBeef"),
+        ],
+    )
+    def test_domain_hash_matches_eth_account(self, chain_id: int, contract: str) -> None:
+        expected = hash_domain(build_eip712_domain(chain_id, contract))
+        assert _domain_hash(chain_id, contract) == expected
+
+    @pytest.mark.parametrize("contract", ["0xDEAD", "0x" + "zz" * 20])
+    def test_domain_hash_rejects_bad_address(self, contract: str) -> None:
+        with pytest.raises(ValueError):
+            _domain_hash(CHAIN_ID, contract)
+
+    def test_signable_matches_encode_typed_data(self) -> None:
+        order    = _make_order(expiration=1_000_000, post_only=True)
+        expected = encode_typed_data(
+            domain_data=build_eip712_domain(CHAIN_ID, VERIFYING_CONTRACT),
+            message_types={k: v for k, v in _EIP712_TYPES.items() if k != "EIP712Domain"},
+            message_data=_build_order_message(order, 7),
+        )
+        assert _signable(_domain_hash(CHAIN_ID, VERIFYING_CONTRACT), order, 7) == expected
+
 
 class TestSignOrder:
     def test_produces_hex_signature(self) -> None:
@@ -144,6 +214,100 @@ class TestSignOrder:
         sig_b = sign_order(order_b, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=1)
         assert sig_a != sig_b
 
+    def test_no_generic_typed_data_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # The type hashes are precomputed; eth_account's generic typed-data
+        # walk must not run when signing or recovering.
+        def fail(*_: object, **__: object) -> None:
+            raise AssertionError("generic EIP-712 encoding used")
+
+        monkeypatch.setattr("eth_account.messages.encode_typed_data", fail)
+        monkeypatch.setattr("eth_account.messages.hash_eip712_message", fail)
+        order = _make_order()
+        sign_order(order, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=4)
+        assert recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=4)
+
+    def test_domain_separator_hashed_once(self) -> None:
+        _domain_hash.cache_clear()
+        for nonce in range(3):
+            order = _make_order()
+            sign_order(order, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=nonce)
+            recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=nonce)
+        assert _domain_hash.cache_info().misses == 1
+
+
+class TestSequenceNonce:
+    def test_consecutive_from_start(self) -> None:
+        nonce = SequenceNonce(start=5)
+        assert [nonce(), nonce(), nonce()] == [5, 6, 7]
+
+    def test_wraps_to_uint32(self) -> None:
+        nonce = SequenceNonce(start=2**32 - 1)
+        assert [nonce(), nonce()] == [2**32 - 1, 0]
+
+    def test_seeded_from_clock(self) -> None:
+        before = _default_nonce()
+        first  = SequenceNonce()()
+        assert 0 < (first - before) & 0xFFFF_FFFF < 10_000
+
+    def test_unique_across_threads(self) -> None:
+        nonce = SequenceNonce(start=0)
+        seen: list[int] = []
+
+        def draw() -> None:
+            seen.extend(nonce() for _ in range(1_000))
+
+        threads = [threading.Thread(target=draw) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(seen) == list(range(4_000))
+
+    def test_default_nonce_is_clock_ms(self) -> None:
+        assert abs(_default_nonce() - (int(time.time() * 1000) & 0xFFFF_FFFF)) < 1_000
+
+
+class TestSignOrders:
+    def test_matches_sign_order(self) -> None:
+        batch  = [_make_order(expiration=1_000_000, post_only=i % 2 == 0) for i in range(3)]
+        single = [_make_order(expiration=1_000_000, post_only=i % 2 == 0) for i in range(3)]
+        nonces = iter([7, 8, 9])
+        sigs   = sign_orders(
+            batch, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce_provider=lambda: next(nonces),
+        )
+        expected = [
+            sign_order(order, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=nonce)
+            for order, nonce in zip(single, [7, 8, 9])
+        ]
+        assert sigs == expected
+        assert [o.signature for o in batch] == sigs
+
+    def test_nonce_provider_called_per_order(self) -> None:
+        calls: list[int] = []
+
+        def my_nonce() -> int:
+            calls.append(1)
+            return 100 + len(calls)
+
+        orders = [_make_order() for _ in range(4)]
+        sign_orders(orders, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce_provider=my_nonce)
+        assert len(calls) == 4
+        assert recover_signer(orders[3], CHAIN_ID, VERIFYING_CONTRACT, nonce=104) == Account.from_key(
+            TEST_PRIVATE_KEY
+        ).address
+
+    def test_default_nonces_distinct(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Freeze the millisecond clock: the whole batch lands in one tick
+        monkeypatch.setattr("grvt_sdk.signing._default_nonce", lambda: 500)
+        orders  = [_make_order() for _ in range(3)]
+        sign_orders(orders, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT)
+        address = Account.from_key(TEST_PRIVATE_KEY).address
+        for order, nonce in zip(orders, [501, 502, 503]):
+            assert recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=nonce) == address
+
+    def test_empty_batch(self) -> None:
+        assert sign_orders([], TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT) == []
+
 
 class TestRecoverSigner:
     def test_recovers_correct_address(self) -> None:
@@ -161,6 +325,43 @@ class TestRecoverSigner:
             recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=0)
 
 
+class TestOrderSigner:
+    def test_matches_sign_order(self) -> None:
+        order1 = _make_order(expiration=1_000_000, post_only=True)
+        order2 = _make_order(expiration=1_000_000, post_only=True)
+        signer = OrderSigner(TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT)
+        sig1 = sign_order(order1, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=5)
+        sig2 = signer.sign(order2, nonce=5)
+        assert sig1 == sig2
+        assert order2.signature == sig2
+
+    def test_recover_signer_round_trip(self) -> None:
+        order  = _make_order(expiration=1_000_000)
+        signer = make_signer(TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT)
+        signer.sign(order, nonce=11)
+        recovered = recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=11)
+        assert recovered == signer.address
+        assert signer.address == Account.from_key(TEST_PRIVATE_KEY).address
+
+    def test_nonce_provider_is_called(self) -> None:
+        nonces = iter([100, 101])
+        signer = make_signer(
+            TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce_provider=lambda: next(nonces),
+        )
+        order = _make_order(expiration=1_000_000)
+        signer.sign(order)
+        assert recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=100) == signer.address
+        signer.sign(order)
+        assert recover_signer(order, CHAIN_ID, VERIFYING_CONTRACT, nonce=101) == signer.address
+
+    def test_domain_bound_at_construction(self) -> None:
+        order1 = _make_order(expiration=1_000_000)
+        order2 = _make_order(expiration=1_000_000)
+        sig1 = OrderSigner(TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT).sign(order1, nonce=1)
+        sig2 = OrderSigner(TEST_PRIVATE_KEY, CHAIN_ID + 1, VERIFYING_CONTRACT).sign(order2, nonce=1)
+        assert sig1 != sig2
+
+
 class TestPriceScaling:
     """Verify that extreme prices / sizes don't cause overflow or precision loss."""
 
@@ -178,3 +379,95 @@ class TestPriceScaling:
         order.legs[0].limit_price = price
         sig = sign_order(order, TEST_PRIVATE_KEY, CHAIN_ID, VERIFYING_CONTRACT, nonce=0)
         assert sig
+
+    @pytest.mark.parametrize(
+        "value, scaled",
+        [
+            ("0.000000001",  1),
+            ("1",            1_000_000_000),
+            ("1.5",          1_500_000_000),
+            ("0.1",          100_000_000),
+            ("1.0000000019", 1_000_000_001),   # below 1e-9 is truncated, not rounded
+        ],
+    )
+    def test_scaled_to_nine_decimals(self, value: str, scaled: int) -> None:
+        # Checked on the signing path: the leg hash must commit to the
+        # scaled integers.  _encode_leg shares the same scaling helper.
+        leg      = _make_order().legs[0]
+        expected = keccak(abi_encode(
+            ["bytes32", "uint256", "uint64", "uint64", "bool"],
+            [_LEG_TYPEHASH, int(leg.instrument_hash, 16), scaled, scaled, leg.is_buying_asset],
+        ))
+        assert _leg_hash(leg.instrument_hash, value, value, leg.is_buying_asset) == expected
+        leg.size = leg.limit_price = value
+        encoded = _encode_leg(leg)
+        assert encoded["size"] == encoded["limitPrice"] == scaled
+
+
+class TestHashOrder:
+    """The precomputed-typehash encoder must match eth_account's generic one."""
+
+    @pytest.mark.parametrize("post_only, reduce_only", [(False, False), (True, False), (False, True)])
+    @pytest.mark.parametrize("expiration", [0, 1, 2**63 - 1])
+    def test_matches_eth_account(self, post_only: bool, reduce_only: bool, expiration: int) -> None:
+        order = _make_order(expiration=expiration, post_only=post_only, reduce_only=reduce_only)
+        expected = hash_eip712_message(_MESSAGE_TYPES, _build_order_message(order, 0xFFFF_FFFF))
+        assert _hash_order(order, 0xFFFF_FFFF) == expected
+
+    def test_multi_leg(self) -> None:
+        order = _make_order()
+        order.legs.append(OrderLeg(
+            instrument_hash="0x" + "cd" * 32, size="2.5", limit_price="0.1", is_buying_asset=False,
+        ))
+        expected = hash_eip712_message(_MESSAGE_TYPES, _build_order_message(order, 9))
+        assert _hash_order(order, 9) == expected
+
+    def test_words_match_abi_encoding(self) -> None:
+        legs_hash = b"\x11" * 32
+        packed = (
+            _uint_word(99, 64, "subAccountID") + _uint_word(3, 8, "timeInForce")
+            + _FALSE_WORD + _TRUE_WORD + legs_hash
+            + _uint_word(2**32 - 1, 32, "nonce") + _int_word(-(2**63), 64, "expiration")
+        )
+        assert packed == abi_encode(
+            ["uint64", "uint8", "bool", "bool", "bytes32", "uint32", "int64"],
+            [99, 3, False, True, legs_hash, 2**32 - 1, -(2**63)],
+        )
+
+    def test_instrument_word_cached(self) -> None:
+        instrument = "0x" + "ab" * 32
+        word       = _instrument_word(instrument)
+        assert word is _instrument_word(instrument)
+        assert int.from_bytes(word, "big") == int(instrument, 16)
+
+    @pytest.mark.parametrize("instrument", ["0xabc", "0X" + "AB" * 32, "ab" * 32])
+    def test_instrument_hash_forms(self, instrument: str) -> None:
+        # Odd-length and unprefixed hashes pass OrderLeg validation, so the
+        # encoder must accept them too (bytes.fromhex would not).
+        order = _make_order()
+        order.legs[0].instrument_hash = instrument
+        expected = hash_eip712_message(_MESSAGE_TYPES, _build_order_message(order, 3))
+        assert _hash_order(order, 3) == expected
+
+    def test_leg_hash_reused_across_nonces(self) -> None:
+        order = _make_order()
+        _leg_hash.cache_clear()
+        _hash_order(order, 1)
+        _hash_order(order, 2)
+        assert _leg_hash.cache_info().hits == 1
+
+    def test_mutated_leg_rehashed(self) -> None:
+        order = _make_order()
+        _hash_order(order, 1)
+        order.legs[0].limit_price = "123.456"
+        expected = hash_eip712_message(_MESSAGE_TYPES, _build_order_message(order, 1))
+        assert _hash_order(order, 1) == expected
+
+    @pytest.mark.parametrize("nonce", [-1, 2**32])
+    def test_nonce_out_of_range(self, nonce: int) -> None:
+        with pytest.raises(ValueError, match="uint32"):
+            _hash_order(_make_order(), nonce)
+
+    def test_expiration_out_of_range(self) -> None:
+        with pytest.raises(ValueError, match="int64"):
+            _hash_order(_make_order(expiration=2**63), 0)
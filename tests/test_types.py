@@ -4,27 +4,44 @@ tests/test_types.py – Pydantic v2 model validation tests.
 All tests run offline.  They verify that:
   1. Valid data constructs cleanly.
   2. Invalid data raises ValidationError with a meaningful message.
-  3. _order_to_dict serialises correctly.
+  3. _order_to_dict and _with_filters build the request bodies correctly.
   4. _parse_order / _parse_orderbook / _parse_account_summary round-trip correctly.
+  5. Decimal string fields accept and reject exactly what Decimal() does.
+  6. The WS stream models validate without Python validator hooks.
 """
 
 from __future__ import annotations
 
+import json
 import time
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from grvt_sdk.rest import _order_to_dict, _parse_order, _parse_orderbook, _parse_account_summary
+from grvt_sdk.rest import (
+    _order_to_dict,
+    _parse_account_summary,
+    _parse_create_response,
+    _parse_order,
+    _parse_orderbook,
+    _parse_orders_json,
+    _parse_trades_json,
+    _with_filters,
+)
 from grvt_sdk.types import (
     Fill,
+    KindEnum,
     Order,
     OrderLeg,
     OrderMetadata,
     OrderStatus,
+    Orderbook,
+    OrderbookLevel,
     OrderUpdate,
     Side,
     TimeInForce,
+    Trade,
 )
 
 # ---------------------------------------------------------------------------
@@ -97,6 +114,11 @@ class TestOrderLegValidation:
         with pytest.raises(ValidationError, match="positive"):
             _leg(limit_price="-100")
 
+    def test_validate_assignment(self) -> None:
+        leg = _leg()
+        with pytest.raises(ValidationError, match="positive"):
+            leg.limit_price = "0"
+
 
 # ---------------------------------------------------------------------------
 # OrderMetadata validation
@@ -123,6 +145,11 @@ class TestOrderMetadataValidation:
         with pytest.raises(ValidationError, match="non-negative"):
             _meta(create_time=-1)
 
+    def test_validate_assignment(self) -> None:
+        m = _meta()
+        with pytest.raises(ValidationError, match="uint32"):
+            m.client_order_id = 0x1_0000_0000
+
 
 # ---------------------------------------------------------------------------
 # Order validation
@@ -157,6 +184,14 @@ class TestOrderValidation:
         with pytest.raises(ValidationError, match="positive"):
             o.sub_account_id = 0
 
+    def test_assignment_validates_only_that_field(self) -> None:
+        # sign_order() sets .signature on every sign; the assignment must not
+        # re-validate the legs (an emptied list would fail if it did).
+        o = _order()
+        o.legs.clear()
+        o.signature = "0x" + "ab" * 65
+        assert o.signature == "0x" + "ab" * 65
+
 
 # ---------------------------------------------------------------------------
 # Serialisation: _order_to_dict
@@ -180,6 +215,22 @@ class TestOrderToDict:
         assert leg_dict["limit_price"] == "50000.0"
         assert leg_dict["is_buying_asset"] is True
 
+    def test_leg_matches_api_shape(self) -> None:
+        leg = _order().legs[0]
+        assert _order_to_dict(_order())["legs"] == [{
+            "instrument":      leg.instrument_hash,
+            "size":            leg.size,
+            "limit_price":     leg.limit_price,
+            "is_buying_asset": leg.is_buying_asset,
+        }]
+
+    @pytest.mark.parametrize("n_legs", [1, 2, 3])
+    def test_legs_match_model_dump(self, n_legs: int) -> None:
+        # The single-leg fast path and the serializer path emit the same shape.
+        legs = [_leg(size=f"0.0{i + 1}", is_buying_asset=i % 2 == 0) for i in range(n_legs)]
+        o    = _order(legs=legs)
+        assert _order_to_dict(o)["legs"] == [leg.model_dump(by_alias=True) for leg in legs]
+
     def test_metadata_keys(self) -> None:
         o = _order()
         meta = _order_to_dict(o)["metadata"]
@@ -192,6 +243,15 @@ class TestOrderToDict:
         assert _order_to_dict(o)["signature"] == "0xdeadbeef"
 
 
+class TestWithFilters:
+    def test_no_filters_leaves_body(self) -> None:
+        assert _with_filters({"sub_account_id": "99"}, None, None, None) == {"sub_account_id": "99"}
+
+    def test_filters_wrapped_in_lists(self) -> None:
+        body = _with_filters({"is_active": [True]}, KindEnum.PERPETUAL, "BTC", "USDT")
+        assert body == {"is_active": [True], "kind": [int(KindEnum.PERPETUAL)], "base": ["BTC"], "quote": ["USDT"]}
+
+
 # ---------------------------------------------------------------------------
 # Deserialisation: _parse_order
 # ---------------------------------------------------------------------------
@@ -238,6 +298,23 @@ class TestParseOrder:
         order = _parse_order(self._raw(order_id="ord_123"))
         assert order.order_id == "ord_123"
 
+    def test_raw_dict_not_mutated(self) -> None:
+        raw = self._raw()
+        _parse_order(raw)
+        assert raw["legs"][0]["instrument"] == FAKE_HASH
+        assert "instrument_hash" not in raw["legs"][0]
+
+    def test_parse_orders_json_envelope(self) -> None:
+        content = json.dumps({
+            "result": {"open_orders": [self._raw(order_id="a"), self._raw(order_id="b")]},
+        }).encode()
+        orders = _parse_orders_json(content).open_orders
+        assert [o.order_id for o in orders] == ["a", "b"]
+        assert orders[1].legs[0].instrument_hash == FAKE_HASH
+
+    def test_parse_orders_json_missing_result(self) -> None:
+        assert _parse_orders_json(b"{}").orders == []
+
 
 # ---------------------------------------------------------------------------
 # Deserialisation: _parse_orderbook
@@ -269,6 +346,77 @@ class TestParseOrderbook:
         assert book.sequence_number == 0
 
 
+# ---------------------------------------------------------------------------
+# Deserialisation: _parse_trades_json
+# ---------------------------------------------------------------------------
+
+class TestParseTrades:
+    def _raw(self, **kwargs) -> dict:
+        base = {
+            "trade_id": "t1",
+            "price": "50000.0",
+            "size": "0.1",
+            "is_taker_buyer": True,
+            "created_time": "1700000000000000000",
+        }
+        base.update(kwargs)
+        return base
+
+    @staticmethod
+    def _parse(trades: list[dict]) -> list[Trade]:
+        content = json.dumps({"result": {"trades": trades}}).encode()
+        return _parse_trades_json("BTC_USDT_Perp", content)
+
+    def test_api_keys_mapped(self) -> None:
+        trade = self._parse([self._raw()])[0]
+        assert trade.instrument == "BTC_USDT_Perp"
+        assert trade.side == Side.BUY
+        assert trade.timestamp == 1_700_000_000_000_000_000
+
+    def test_taker_seller_is_sell(self) -> None:
+        trade = self._parse([self._raw(is_taker_buyer=False)])[0]
+        assert trade.side == Side.SELL
+
+    def test_missing_result_is_empty(self) -> None:
+        assert _parse_trades_json("BTC_USDT_Perp", b"{}") == []
+
+    def test_invalid_price_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="valid decimal"):
+            self._parse([self._raw(price="abc")])
+
+    def test_ws_shape_still_accepted(self) -> None:
+        trade = Trade.model_validate({
+            "trade_id": "t2", "instrument": "ETH_USDT_Perp", "price": "1", "size": "1",
+            "side": 2, "timestamp": 5,
+        })
+        assert trade.side == Side.SELL
+        assert trade.instrument == "ETH_USDT_Perp"
+
+    def test_rest_shape_not_accepted_by_trade(self) -> None:
+        with pytest.raises(ValidationError):
+            Trade.model_validate(self._raw(instrument="BTC_USDT_Perp"))
+
+
+# ---------------------------------------------------------------------------
+# Deserialisation: _parse_create_response
+# ---------------------------------------------------------------------------
+
+class TestParseCreateResponse:
+    def test_wrapped_status_mapped_to_enum(self) -> None:
+        resp = _parse_create_response({"result": {"order_id": "o1", "status": "3"}})
+        assert resp.status is OrderStatus.FILLED
+        assert resp.reason is None
+
+    def test_unwrapped_defaults_to_open(self) -> None:
+        resp = _parse_create_response({"order_id": "o1", "reason": "ok"})
+        assert resp.status is OrderStatus.OPEN
+        assert resp.reason == "ok"
+
+    def test_unknown_status_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            _parse_create_response({"order_id": "o1", "status": 99})
+
+
 # ---------------------------------------------------------------------------
 # Deserialisation: _parse_account_summary
 # ---------------------------------------------------------------------------
@@ -303,6 +451,13 @@ class TestParseAccountSummary:
         assert summary.available_margin == "0"
         assert summary.positions == []
 
+    def test_argument_sub_account_wins(self) -> None:
+        assert _parse_account_summary(1, {"sub_account_id": "999"}).sub_account_id == 1
+
+    def test_default_positions_not_shared(self) -> None:
+        _parse_account_summary(1, {}).positions.append(None)  # type: ignore[arg-type]
+        assert _parse_account_summary(2, {}).positions == []
+
 
 # ---------------------------------------------------------------------------
 # WS event models
@@ -347,9 +502,48 @@ class TestOrderUpdate:
         assert u.timestamp == 0
 
     def test_invalid_filled_size(self) -> None:
-        with pytest.raises(ValidationError, match="non-empty decimal"):
+        with pytest.raises(ValidationError, match="non-empty"):
             OrderUpdate(
                 order_id="o1", client_order_id=1, instrument="BTC_USDT_Perp",
                 status=OrderStatus.OPEN, filled_size="", remaining_size="0.01",
                 avg_fill_price="0.0",
             )
+
+
+# ---------------------------------------------------------------------------
+# Decimal string fields (compiled-regex fast path, Decimal() fallback)
+# ---------------------------------------------------------------------------
+
+class TestDecimalStringFields:
+    @pytest.mark.parametrize(
+        "value",
+        ["0", "-0.01", "+1.5", "50000.", ".5", "1e-9", "1E+3", " 1.5 ", "1_000", "NaN", "Infinity"],
+    )
+    def test_accepts_what_decimal_accepts(self, value: str) -> None:
+        assert OrderbookLevel(price=value, size=value).price == value
+
+    @pytest.mark.parametrize("value", ["abc", "1.2.3", "1e", "--1", "0x10"])
+    def test_rejects_what_decimal_rejects(self, value: str) -> None:
+        with pytest.raises(ValidationError, match="valid decimal"):
+            OrderbookLevel(price=value, size="1")
+
+    def test_empty_string_message(self) -> None:
+        with pytest.raises(ValidationError, match="non-empty"):
+            OrderbookLevel(price=" ", size="1")
+
+    @pytest.mark.parametrize("value", ["abc", " ", 3])
+    def test_single_error_at_field_loc(self, value: Any) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            OrderbookLevel(price=value, size="1")
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"]  == ("price",)
+        assert errors[0]["type"] == "decimal_string"
+
+    @pytest.mark.parametrize("model", [OrderbookLevel, Orderbook, Trade, Fill, OrderUpdate])
+    def test_stream_models_validate_without_python_hooks(self, model: type) -> None:
+        # Per-message WS validation stays inside pydantic-core: no Python
+        # field or model validators on the high-rate stream types.
+        decorators = model.__pydantic_decorators__
+        assert not decorators.field_validators
+        assert not decorators.model_validators
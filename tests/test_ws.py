@@ -8,10 +8,15 @@ They verify:
   3. Typed deserialization via msg_type.
   4. Sequence number gap detection and on_gap callback.
   5. Unsubscribe removes the channel and clears its sequence state.
+  6. Batched subscriptions deliver lists in arrival order.
+  7. close() releases the auth-owned aiohttp login session and stops batch
+     tasks, which run_forever() restarts on a reused client.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 
 import pytest
 
@@ -74,11 +79,33 @@ class TestDeserialize:
         assert result == {}   # falls back to data dict
 
 
+    def test_dataclass_msg_type_ignores_extra_keys(self) -> None:
+        @dataclass
+        class Tick:
+            price: str
+
+        result = _deserialize({"data": {"price": "1", "extra": 0}}, Tick)
+        assert result == Tick(price="1")
+
+
 # ---------------------------------------------------------------------------
 # Subscription registration
 # ---------------------------------------------------------------------------
 
 class TestSubscriptionRegistration:
+    @pytest.mark.asyncio
+    async def test_decoder_resolved_at_subscribe(self) -> None:
+        client = _make_client()
+
+        async def handler(book: Orderbook) -> None:
+            pass
+
+        await client.subscribe("orderbook.BTC_USDT_Perp", handler, msg_type=Orderbook)
+        await client.subscribe("trades", handler)
+        typed, raw = client._subscriptions
+        assert typed.decoder == Orderbook.model_validate
+        assert raw.decoder is None
+
     @pytest.mark.asyncio
     async def test_subscribe_adds_to_list(self) -> None:
         client = _make_client()
@@ -205,6 +232,71 @@ class TestDispatch:
         assert after == [1]
 
 
+# ---------------------------------------------------------------------------
+# Batched dispatch
+# ---------------------------------------------------------------------------
+
+class TestBatchedDispatch:
+    @pytest.mark.asyncio
+    async def test_queued_messages_delivered_as_batches(self) -> None:
+        client  = _make_client()
+        batches: list[list[dict]] = []
+
+        async def handler(batch: list[dict]) -> None:
+            batches.append(batch)
+
+        await client.subscribe("trades", handler, batch_size=3)
+        for i in range(5):
+            await client._dispatch("trades.X", _msg("trades.X", {}, seq=i))
+        await asyncio.sleep(0)   # let the batch task drain the queue
+
+        assert [len(b) for b in batches] == [3, 2]
+        assert [m["sequence_number"] for b in batches for m in b] == [0, 1, 2, 3, 4]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_waits_for_more(self) -> None:
+        client  = _make_client()
+        batches: list[list[dict]] = []
+
+        async def handler(batch: list[dict]) -> None:
+            batches.append(batch)
+
+        await client.subscribe("trades", handler, batch_size=4, batch_timeout=1.0)
+        await client._dispatch("trades.X", _msg("trades.X", {}, seq=1))
+        await asyncio.sleep(0.01)
+        assert batches == []      # still waiting to fill
+        for seq in (2, 3, 4):
+            await client._dispatch("trades.X", _msg("trades.X", {}, seq=seq))
+        await asyncio.sleep(0.01)
+
+        assert [len(b) for b in batches] == [4]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_batch_task(self) -> None:
+        client = _make_client()
+
+        async def handler(_: list) -> None:
+            pass
+
+        await client.subscribe("trades", handler, batch_size=2)
+        task = client._subscriptions[0].task
+        await client.unsubscribe("trades")
+        await asyncio.sleep(0)
+        assert task is not None and task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_size_rejected(self) -> None:
+        client = _make_client()
+
+        async def handler(_: list) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="batch_size"):
+            await client.subscribe("trades", handler, batch_size=0)
+
+
 # ---------------------------------------------------------------------------
 # Typed dispatch
 # ---------------------------------------------------------------------------
@@ -334,3 +426,108 @@ class TestSequenceGapDetection:
 
         # Should not raise even though on_gap crashes
         await client._check_sequence("trades", {"sequence_number": 5})
+
+
+# ---------------------------------------------------------------------------
+# Receive loop: wire frames → decode → dispatch
+# ---------------------------------------------------------------------------
+
+class _FakeWS:
+    """Async-iterable stand-in for a websockets connection."""
+
+    def __init__(self, frames: list) -> None:
+        self._frames = frames
+
+    def __aiter__(self):
+        return self._aiter()
+
+    async def _aiter(self):
+        for frame in self._frames:
+            yield frame
+
+
+class TestRecvLoop:
+    @pytest.mark.asyncio
+    async def test_decodes_str_and_bytes_frames(self) -> None:
+        client = _make_client()
+        received: list[Orderbook] = []
+
+        async def handler(book: Orderbook) -> None:
+            received.append(book)
+
+        await client.subscribe("orderbook.BTC_USDT_Perp", handler, msg_type=Orderbook)
+
+        frame = (
+            '{"channel": "orderbook.BTC_USDT_Perp", "sequence_number": 1,'
+            ' "data": {"instrument": "BTC_USDT_Perp",'
+            ' "bids": [{"price": "49000.0", "size": "1.0"}], "asks": []}}'
+        )
+        await client._recv_loop(_FakeWS([frame, frame.replace('": 1,', '": 2,').encode()]))
+
+        assert len(received) == 2
+        assert all(isinstance(b, Orderbook) for b in received)
+        assert received[1].bids[0].price == "49000.0"
+        assert client._seq["orderbook.BTC_USDT_Perp"] == 2
+
+    @pytest.mark.asyncio
+    async def test_non_json_frame_skipped(self) -> None:
+        client = _make_client()
+        received = []
+
+        async def handler(msg: dict) -> None:
+            received.append(msg)
+
+        await client.subscribe("trades", handler)
+        await client._recv_loop(_FakeWS(["not json", '{"channel": "trades.X", "data": {}}']))
+
+        assert len(received) == 1
+        assert received[0]["channel"] == "trades.X"
+
+
+# ---------------------------------------------------------------------------
+# Shutdown
+# ---------------------------------------------------------------------------
+
+class _FakeHTTPSession:
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestClose:
+    @pytest.mark.asyncio
+    async def test_closes_auth_login_session(self) -> None:
+        client  = _make_client()
+        session = _FakeHTTPSession()
+        client._auth._aiohttp_session = session
+        await client.close()
+        assert session.closed is True
+        assert client._auth._aiohttp_session is None
+
+    @pytest.mark.asyncio
+    async def test_batch_delivery_restarts_after_close(self) -> None:
+        client  = _make_client()
+        batches: list[list[dict]] = []
+
+        async def handler(batch: list[dict]) -> None:
+            batches.append(batch)
+
+        await client.subscribe("trades", handler, batch_size=2)
+        sub = client._subscriptions[0]
+        old = sub.task
+        await client.close()
+        assert old is not None and old.done()
+        assert sub.task is None
+
+        async def connect_once() -> None:
+            await client._dispatch("trades.X", _msg("trades.X", {}, seq=1))
+            await client._dispatch("trades.X", _msg("trades.X", {}, seq=2))
+            await asyncio.sleep(0)   # let the restarted batch task drain
+            client._running = False
+
+        client._connect_and_run = connect_once  # type: ignore[method-assign]
+        await client.run_forever()
+        assert sub.task is not None and sub.task is not old
+        assert [len(b) for b in batches] == [2]
+        await client.close()